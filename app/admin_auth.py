@@ -1,67 +1,134 @@
+import base64
+import binascii
+import hashlib
+import hmac
 import secrets
-from datetime import datetime, timedelta
+import threading
+import time
+from cachetools import TTLCache
 from fastapi import HTTPException, Depends, Request
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi.security import HTTPBasicCredentials
 import os
 
-# Simple admin token storage (in memory - restart resets tokens)
-active_tokens = {}
+SESSION_TTL_SECONDS = 8 * 3600  # 8 hours
 
-security = HTTPBasic()
+# Simple admin token storage (in memory - restart resets tokens).
+# TTLCache expires sessions on access and bounds memory for admins who never return.
+active_tokens = TTLCache(maxsize=10000, ttl=SESSION_TTL_SECONDS, timer=time.monotonic)
+_tokens_lock = threading.Lock()  # cachetools is not thread-safe for writes
+
+# Short-lived verification results (username or None), keyed by a hash prefix so raw tokens are not duplicated
+_decision_cache = TTLCache(maxsize=4096, ttl=30, timer=time.monotonic)
+
+_SENTINEL = object()
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+_BASIC_CHALLENGE = {"WWW-Authenticate": "Basic"}
+
+async def basic_credentials(request: Request) -> HTTPBasicCredentials:
+    """Parse HTTP Basic credentials, failing fast when the header is missing"""
+    auth = request.headers.get("authorization")
+    if not auth or not auth.startswith("Basic "):
+        raise HTTPException(status_code=401, detail="Not authenticated", headers=_BASIC_CHALLENGE)
+    try:
+        decoded = base64.b64decode(auth[6:], validate=True).decode("latin-1")
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials", headers=_BASIC_CHALLENGE)
+    username, separator, password = decoded.partition(":")
+    if not separator:
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials", headers=_BASIC_CHALLENGE)
+    return HTTPBasicCredentials(username=username, password=password)
 
 # Read from environment variables
 ADMIN_USERNAME = os.environ.get('ADMIN_USERNAME', 'admin')
-ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', 'change_this_now')
 
-def verify_admin(credentials: HTTPBasicCredentials = Depends(security)):
+def _credentials_digest(username: str, password: str) -> bytes:
+    return hashlib.sha256((username + "\0" + password).encode()).digest()
+
+def _load_admin_credentials_digest() -> bytes:
+    # The plaintext password is hashed once and removed from the environment,
+    # so it never lives in a module global
+    password = os.environ.pop('ADMIN_PASSWORD', 'change_this_now')
+    return _credentials_digest(ADMIN_USERNAME, password)
+
+# Username and password are compared as one fixed-size digest so timing
+# does not reveal which of the two was wrong
+_ADMIN_CREDENTIALS_DIGEST = _load_admin_credentials_digest()
+
+def verify_admin(credentials: HTTPBasicCredentials = Depends(basic_credentials)):
     """Basic HTTP auth for admin"""
-    correct_username = secrets.compare_digest(credentials.username, ADMIN_USERNAME)
-    correct_password = secrets.compare_digest(credentials.password, ADMIN_PASSWORD)
+    provided = _credentials_digest(credentials.username, credentials.password)
     
-    if not (correct_username and correct_password):
+    if not hmac.compare_digest(provided, _ADMIN_CREDENTIALS_DIGEST):
         raise HTTPException(
             status_code=401,
             detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Basic"},
+            headers=_BASIC_CHALLENGE,
         )
     return credentials.username
 
 def create_session_token(username: str) -> str:
     """Create a session token after login"""
     token = secrets.token_urlsafe(32)
-    active_tokens[token] = {
-        "username": username,
-        "created_at": datetime.utcnow(),
-        "expires_at": datetime.utcnow() + timedelta(hours=8)
-    }
+    with _tokens_lock:
+        active_tokens[token] = {
+            "username": username,
+            "created_at": time.time()  # audit only, expiry is handled by the cache
+        }
     return token
 
+def _session_username(token: str):
+    """Username for a live session token, else None, memoized for 30 seconds"""
+    key = _token_key(token)
+    with _tokens_lock:
+        cached = _decision_cache.get(key, _SENTINEL)
+        if cached is not _SENTINEL:
+            return cached
+        # TTLCache evicts expired entries on lookup
+        session = active_tokens.get(token)
+        username = session["username"] if session else None
+        _decision_cache[key] = username
+    return username
+
 def verify_session_token(token: str) -> bool:
     """Verify session token"""
-    if token not in active_tokens:
-        return False
-    
-    session = active_tokens[token]
-    if datetime.utcnow() > session["expires_at"]:
-        del active_tokens[token]
-        return False
-    
-    return True
+    return _session_username(token) is not None
+
+def revoke_session_token(token: str):
+    """Invalidate a session token on logout"""
+    with _tokens_lock:
+        active_tokens.pop(token, None)
+        _decision_cache.pop(_token_key(token), None)
 
 def get_current_admin(request: Request):
     """Get current admin from session token in cookie"""
+    # Resolved once per request and cached on request.state
+    cached = getattr(request.state, "_admin_user", _SENTINEL)
+    if cached is not _SENTINEL:
+        return cached
+    
+    user = None
     token = request.cookies.get("admin_token")
-    if not token or not verify_session_token(token):
-        return None
-    return active_tokens[token].get("username")
+    if token:
+        user = _session_username(token)
+    request.state._admin_user = user
+    return user
+
+_LOGIN_REDIRECT = {"Location": "/admin/login"}
+
+async def require_admin(request: Request) -> str:
+    """Dependency for admin pages: the logged-in admin, else redirect to login"""
+    admin = get_current_admin(request)
+    if not admin:
+        raise HTTPException(status_code=303, headers=_LOGIN_REDIRECT)
+    return admin
 
 def verify_admin_credentials(username: str, password: str) -> bool:
-    """Verify admin credentials (for password change)"""
-    from app.admin_auth import ADMIN_USERNAME, ADMIN_PASSWORD
-    import secrets
-    
-    return (secrets.compare_digest(username, ADMIN_USERNAME) and 
-            secrets.compare_digest(password, ADMIN_PASSWORD))
+    """Verify admin credentials (login form and password change)"""
+    provided = _credentials_digest(username, password)
+    return hmac.compare_digest(provided, _ADMIN_CREDENTIALS_DIGEST)
 
 def update_admin_password(username: str, new_password: str):
     """Update admin password (you'll need to store this securely)"""
@@ -1,18 +1,32 @@
 """
 API v1 router and endpoints.
+
+Endpoint modules pull in SQLAlchemy models and fetcher code, so they are
+imported when the routers are registered rather than when this package is
+imported.
 """
 from fastapi import APIRouter
 
-# Import all endpoint routers
-from app.api.v1.endpoints.articles import router as articles_router
-from app.api.v1.endpoints.sources import router as sources_router
-from app.api.v1.endpoints.categories import router as categories_router
-from app.api.v1.endpoints.health import router as health_router
-
 api_router = APIRouter()
+_routers_registered = False
+
+
+def register_routers(router: APIRouter = api_router) -> APIRouter:
+    """Include all v1 endpoint routers (call once at app startup)."""
+    global _routers_registered
+    if router is api_router and _routers_registered:
+        return router
+
+    from app.api.v1.endpoints.articles import router as articles_router
+    from app.api.v1.endpoints.sources import router as sources_router
+    from app.api.v1.endpoints.categories import router as categories_router
+    from app.api.v1.endpoints.health import router as health_router
+
+    router.include_router(articles_router, prefix="/articles", tags=["articles"])
+    router.include_router(sources_router, prefix="/sources", tags=["sources"])
+    router.include_router(categories_router, prefix="/categories", tags=["categories"])
+    router.include_router(health_router, prefix="/health", tags=["health"])
 
-# Include all routers
-api_router.include_router(articles_router, prefix="/articles", tags=["articles"])
-api_router.include_router(sources_router, prefix="/sources", tags=["sources"])
-api_router.include_router(categories_router, prefix="/categories", tags=["categories"])
-api_router.include_router(health_router, prefix="/health", tags=["health"])
\ No newline at end of file
+    if router is api_router:
+        _routers_registered = True
+    return router
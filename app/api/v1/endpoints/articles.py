@@ -1,19 +1,38 @@
 """
 Articles API Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, or_
+from sqlalchemy import desc, func, or_, select
 from typing import Optional, List
 from datetime import datetime, timedelta
 
 from ....database import get_db
 from ....models.article import Article, Category
+from ....models.minimal_models import RELATED_ARTICLES
 
 router = APIRouter()
 
+# List views select plain columns and serialize the row mappings with orjson
+# (datetimes included), skipping ORM instances and per-field dict building.
+_CATEGORY_NAME = func.coalesce(Category.name, "General").label("category_name")
+
+_LIST_COLUMNS = (
+    Article.id, Article.title, Article.description, Article.url,
+    Article.url_to_image, Article.published_at, Article.content,
+    Article.description.label("summary"), Article.category_id, _CATEGORY_NAME, Article.source,
+    Article.author, Article.language, Article.is_breaking, Article.created_at,
+)
+
+_TRENDING_COLUMNS = (
+    Article.id, Article.title, Article.description, Article.url_to_image,
+    Article.published_at, _CATEGORY_NAME, Article.source, Article.language,
+    Article.view_count,
+)
+
 @router.get("")
-async def get_articles(
+def get_articles(
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
@@ -24,22 +43,22 @@ async def get_articles(
 ):
     """Get articles with filtering."""
     try:
-        query = db.query(Article)
+        query = select(*_LIST_COLUMNS).outerjoin(Category, Article.category_id == Category.id)
         
         # Apply category filter
         if category:
             category_obj = db.query(Category).filter(Category.name == category).first()
             if category_obj:
-                query = query.filter(Article.category_id == category_obj.id)
+                query = query.where(Article.category_id == category_obj.id)
         
         # Apply language filter
         if language and language != "all":
-            query = query.filter(Article.language == language)
+            query = query.where(Article.language == language)
         
         # Apply search filter
         if search:
             search_term = f"%{search}%"
-            query = query.filter(
+            query = query.where(
                 or_(
                     Article.title.ilike(search_term),
                     Article.description.ilike(search_term),
@@ -50,51 +69,30 @@ async def get_articles(
         # Apply breaking news filter (last 24 hours)
         if breaking:
             time_threshold = datetime.now() - timedelta(hours=24)
-            query = query.filter(Article.published_at >= time_threshold)
-        
-        # Order by most recent
-        query = query.order_by(desc(Article.published_at))
+            query = query.where(Article.published_at >= time_threshold)
         
         # Get total count
-        total = query.count()
-        
-        # Apply pagination
-        articles = query.offset(skip).limit(limit).all()
-        
-        # Convert to dict with category names
-        result = []
-        for article in articles:
-            article_dict = {
-                "id": article.id,
-                "title": article.title,
-                "description": article.description,
-                "url": article.url,
-                "url_to_image": article.url_to_image,
-                "published_at": article.published_at.isoformat() if article.published_at else None,
-                "content": article.content,
-                "summary": article.summary,
-                "category_id": article.category_id,
-                "category_name": article.category.name if article.category else "General",
-                "source": article.source,
-                "author": article.author,
-                "language": article.language,
-                "is_breaking": article.is_breaking,
-                "created_at": article.created_at.isoformat() if article.created_at else None
-            }
-            result.append(article_dict)
-        
-        return {
-            "articles": result,
-            "total": total,
-            "skip": skip,
-            "limit": limit
-        }
+        total = db.scalar(select(func.count()).select_from(query.subquery()))
+        
+        # Order by most recent and paginate
+        query = query.order_by(desc(Article.published_at)).offset(skip).limit(limit)
+        articles = [dict(row) for row in db.execute(query).mappings()]
+        
+        return Response(
+            content=orjson.dumps({
+                "articles": articles,
+                "total": total,
+                "skip": skip,
+                "limit": limit
+            }),
+            media_type="application/json"
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching articles: {str(e)}")
 
 @router.get("/{article_id}")
-async def get_article(article_id: int, db: Session = Depends(get_db)):
+def get_article(article_id: int, db: Session = Depends(get_db)):
     """Get single article by ID."""
     try:
         article = db.query(Article).filter(Article.id == article_id).first()
@@ -102,11 +100,12 @@ async def get_article(article_id: int, db: Session = Depends(get_db)):
             raise HTTPException(status_code=404, detail="Article not found")
         
         # Get related articles (same category)
-        related = db.query(Article).filter(
-            Article.category_id == article.category_id,
-            Article.id != article.id,
-            Article.language == article.language
-        ).order_by(desc(Article.published_at)).limit(5).all()
+        related = db.scalars(RELATED_ARTICLES, {
+            "category_id": article.category_id,
+            "article_id": article.id,
+            "language": article.language,
+            "n": 5
+        }).all()
         
         related_list = []
         for rel in related:
@@ -147,36 +146,30 @@ async def get_article(article_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching article: {str(e)}")
 
 @router.get("/trending/")
-async def get_trending_articles(
+def get_trending_articles(
     db: Session = Depends(get_db),
     limit: int = Query(10, ge=1, le=50)
 ):
-    """Get trending articles (last 3 days)."""
+    """Get the most viewed articles from the last 3 days."""
     try:
         time_threshold = datetime.now() - timedelta(days=3)
         
-        articles = db.query(Article).filter(
-            Article.published_at >= time_threshold
-        ).order_by(desc(Article.published_at)).limit(limit).all()
-        
-        result = []
-        for article in articles:
-            article_dict = {
-                "id": article.id,
-                "title": article.title,
-                "description": article.description,
-                "url_to_image": article.url_to_image,
-                "published_at": article.published_at.isoformat() if article.published_at else None,
-                "category_name": article.category.name if article.category else "General",
-                "source": article.source,
-                "language": article.language
-            }
-            result.append(article_dict)
-        
-        return {
-            "articles": result,
-            "count": len(result)
-        }
+        query = (
+            select(*_TRENDING_COLUMNS)
+            .outerjoin(Category, Article.category_id == Category.id)
+            .where(Article.published_at >= time_threshold)
+            .order_by(desc(Article.view_count), desc(Article.published_at))
+            .limit(limit)
+        )
+        articles = [dict(row) for row in db.execute(query).mappings()]
+        
+        return Response(
+            content=orjson.dumps({
+                "articles": articles,
+                "count": len(articles)
+            }),
+            media_type="application/json"
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching trending articles: {str(e)}")
\ No newline at end of file
@@ -1,11 +1,32 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ...database import get_db
-from ...models.article import Category
+from typing import List, Optional
+import orjson
+from fastapi import APIRouter, Response
+from ....database import SessionLocal
+from ....models.article import Category
+from ....schemas.category import CategoryOut
 
 router = APIRouter()
 
-@router.get("")
-async def get_categories(db: Session = Depends(get_db)):
-    categories = db.query(Category).all()
-    return categories
\ No newline at end of file
+# Categories almost never change, so the serialized list is built once and
+# swapped out only when an admin edits categories
+_categories_json: Optional[bytes] = None
+
+def invalidate_categories():
+    """Drop the serialized category list so the next request rebuilds it."""
+    global _categories_json
+    _categories_json = None
+
+def _load_categories_json() -> bytes:
+    global _categories_json
+    if _categories_json is None:
+        with SessionLocal() as db:
+            rows = db.query(Category.id, Category.name, Category.description).all()
+        _categories_json = orjson.dumps(
+            [{"id": r.id, "name": r.name, "description": r.description} for r in rows]
+        )
+    return _categories_json
+
+# The cached bytes are returned as-is; the schema is only declared for the docs
+@router.get("", response_class=Response, responses={200: {"model": List[CategoryOut]}})
+def get_categories():
+    return Response(content=_load_categories_json(), media_type="application/json")
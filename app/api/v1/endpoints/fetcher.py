@@ -3,12 +3,13 @@ from sqlalchemy.orm import Session
 from ....database import get_db
 from ....models.article import Article, NewsSource
 from ....core.tasks import fetch_latest_news
-from ....core.config import settings
+from ....core.config import get_settings
 
 router = APIRouter()
 
 @router.get("/stats")
-async def get_fetcher_stats(db: Session = Depends(get_db)):
+def get_fetcher_stats(db: Session = Depends(get_db)):
+    settings = get_settings()
     total = db.query(Article).count()
     english = db.query(Article).filter(Article.language == "en").count()
     kinyarwanda = db.query(Article).filter(Article.language == "rw").count()
@@ -27,6 +28,7 @@ async def get_fetcher_stats(db: Session = Depends(get_db)):
 
 @router.get("/sources")
 async def get_sources():
+    settings = get_settings()
     return {
         "sources": settings.RSS_FEEDS,
         "count": len(settings.RSS_FEEDS)
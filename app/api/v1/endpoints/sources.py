@@ -1,16 +1,27 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from ...database import get_db
-from ...models.article import Article
+from ....core.caches import sources_cache
+from ....database import get_db
+from ....models.article import Article, NewsSource
+from ....schemas.source import SourceListResponse
 
 router = APIRouter()
 
-@router.get("/sources")
-async def get_sources(db: Session = Depends(get_db)):
+@router.get("/sources", response_model=SourceListResponse)
+def get_sources(db: Session = Depends(get_db)):
     """Get unique news sources."""
+    if "v" in sources_cache:
+        return sources_cache["v"]
     try:
-        sources = db.query(Article.source).distinct().all()
-        sources = [s[0] for s in sources if s[0]]
-        return {"sources": sources}
+        # The news_sources table is tiny; scanning articles is only needed
+        # for legacy databases that never registered their sources
+        sources = db.query(NewsSource.name).filter(NewsSource.is_active == True).all()
+        if not sources:
+            sources = db.query(Article.source).filter(
+                Article.source.isnot(None), Article.source != ""
+            ).distinct().all()
+        result = {"sources": [s[0] for s in sources]}
+        sources_cache["v"] = result
+        return result
     except Exception as e:
-        return {"sources": []}
\ No newline at end of file
+        return {"sources": []}
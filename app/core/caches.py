@@ -0,0 +1,23 @@
+"""
+In-process caches shared between the API and the ingestion services.
+"""
+import threading
+
+from cachetools import TTLCache
+
+# The source list only changes when ingestion registers new news_sources rows
+sources_cache = TTLCache(maxsize=1, ttl=300)
+
+def invalidate_sources_cache():
+    """Drop the cached source list (called after news_sources rows are created)."""
+    sources_cache.clear()
+
+# Rendered /api/v1/articles pages keyed by (skip, limit, category, language).
+# Entries expire after 30s and are dropped whenever articles change.
+feed_cache = TTLCache(maxsize=512, ttl=30)
+feed_cache_lock = threading.Lock()
+
+def invalidate_feed_cache(*_args, **_kwargs):
+    """Drop every cached feed page; usable directly as an event listener."""
+    with feed_cache_lock:
+        feed_cache.clear()
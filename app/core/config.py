@@ -1,10 +1,48 @@
 """
 Application Configuration
 """
+from dataclasses import dataclass
+from functools import lru_cache
 from pydantic_settings import BaseSettings
-from typing import List, Dict
+from typing import Tuple
 import os
 
+
+@dataclass(slots=True, frozen=True)
+class FeedSpec:
+    """A configured RSS feed."""
+    name: str
+    url: str
+    language: str
+    category: str
+
+
+# RSS Feeds Configuration - built once at import and shared read-only
+RSS_FEEDS: Tuple[FeedSpec, ...] = (
+    # English Sources
+    FeedSpec(name="BBC World", url="http://feeds.bbci.co.uk/news/world/rss.xml",
+             language="en", category="World"),
+    FeedSpec(name="BBC Technology", url="http://feeds.bbci.co.uk/news/technology/rss.xml",
+             language="en", category="Technology"),
+    FeedSpec(name="BBC Business", url="http://feeds.bbci.co.uk/news/business/rss.xml",
+             language="en", category="Business"),
+    FeedSpec(name="Reuters World", url="http://feeds.reuters.com/Reuters/worldNews",
+             language="en", category="World"),
+    FeedSpec(name="Reuters Technology", url="http://feeds.reuters.com/reuters/technologyNews",
+             language="en", category="Technology"),
+    
+    # Kinyarwanda Sources
+    FeedSpec(name="IGIHE", url="https://en.igihe.com/rss",
+             language="rw", category="General"),
+    FeedSpec(name="New Times Rwanda", url="https://www.newtimes.co.rw/rss",
+             language="rw", category="General"),
+    FeedSpec(name="KT Press", url="https://www.ktpress.rw/feed/",
+             language="rw", category="General"),
+    FeedSpec(name="BBC Gahuza", url="https://www.bbc.com/gahuza/afs/feed",
+             language="rw", category="World"),
+)
+
+
 class Settings(BaseSettings):
     # Application
     APP_NAME: str = "Globe News"
@@ -15,65 +53,7 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./globe_news.db"
     
     # RSS Feeds Configuration
-    RSS_FEEDS: List[Dict[str, str]] = [
-        # English Sources
-        {
-            "name": "BBC World",
-            "url": "http://feeds.bbci.co.uk/news/world/rss.xml",
-            "language": "en",
-            "category": "World"
-        },
-        {
-            "name": "BBC Technology",
-            "url": "http://feeds.bbci.co.uk/news/technology/rss.xml", 
-            "language": "en",
-            "category": "Technology"
-        },
-        {
-            "name": "BBC Business",
-            "url": "http://feeds.bbci.co.uk/news/business/rss.xml",
-            "language": "en", 
-            "category": "Business"
-        },
-        {
-            "name": "Reuters World",
-            "url": "http://feeds.reuters.com/Reuters/worldNews",
-            "language": "en",
-            "category": "World"
-        },
-        {
-            "name": "Reuters Technology",
-            "url": "http://feeds.reuters.com/reuters/technologyNews",
-            "language": "en",
-            "category": "Technology"
-        },
-        
-        # Kinyarwanda Sources
-        {
-            "name": "IGIHE",
-            "url": "https://en.igihe.com/rss",
-            "language": "rw",
-            "category": "General"
-        },
-        {
-            "name": "New Times Rwanda",
-            "url": "https://www.newtimes.co.rw/rss",
-            "language": "rw", 
-            "category": "General"
-        },
-        {
-            "name": "KT Press",
-            "url": "https://www.ktpress.rw/feed/",
-            "language": "rw",
-            "category": "General"
-        },
-        {
-            "name": "BBC Gahuza",
-            "url": "https://www.bbc.com/gahuza/afs/feed",
-            "language": "rw",
-            "category": "World"
-        }
-    ]
+    RSS_FEEDS: Tuple[FeedSpec, ...] = RSS_FEEDS
     
     # News fetching interval (in seconds)
     FETCH_INTERVAL: int = 3600  # 1 hour
@@ -88,4 +68,15 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
 
-settings = Settings()
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build settings on first use instead of at import time."""
+    return Settings()
+
+
+def __getattr__(name):
+    # Keep `from app.core.config import settings` working
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
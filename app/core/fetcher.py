@@ -7,6 +7,7 @@ import feedparser
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import logging
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from urllib.parse import urlparse
 import newspaper
@@ -14,7 +15,8 @@ from newspaper import Article as NewsArticle
 import re
 
 from ..models.article import Article, Category, NewsSource
-from ..core.config import settings
+from ..models.minimal_models import ARTICLE_ID_BY_URL
+from ..core.config import FeedSpec, get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,7 @@ class NewsFetcher:
     def __init__(self, db: Session):
         self.db = db
         self.session = None
+        self.category_ids: Dict[str, int] = {}
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     
     async def __aenter__(self):
@@ -38,36 +41,45 @@ class NewsFetcher:
         """Fetch news from all configured RSS feeds."""
         logger.info("Starting news fetch from all sources...")
         
+        feeds = get_settings().RSS_FEEDS
+        self.category_ids = self._resolve_category_ids(
+            {feed_config.category or 'General' for feed_config in feeds}
+        )
+        
         tasks = []
-        for feed_config in settings.RSS_FEEDS:
+        for feed_config in feeds:
             task = self.fetch_single_feed(feed_config)
             tasks.append(task)
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        saved_count = 0
-        for result in results:
-            if isinstance(result, list):
-                saved_count += len(result)
+        rows = (row for result in results if isinstance(result, list) for row in result)
+        try:
+            saved_count = Article.bulk_upsert(self.db, rows)
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error saving articles: {e}")
+            self.db.rollback()
+            saved_count = 0
         
         logger.info(f"Successfully fetched {saved_count} new articles")
         return saved_count
     
-    async def fetch_single_feed(self, feed_config: Dict[str, str]) -> List[Article]:
+    async def fetch_single_feed(self, feed_config: FeedSpec) -> List[Dict[str, Any]]:
         """Fetch and parse a single RSS feed."""
         try:
-            logger.info(f"Fetching from {feed_config['name']}...")
+            logger.info(f"Fetching from {feed_config.name}...")
             
-            async with self.session.get(feed_config["url"], timeout=30) as response:
+            async with self.session.get(feed_config.url, timeout=30) as response:
                 if response.status != 200:
-                    logger.warning(f"Failed to fetch {feed_config['name']}: HTTP {response.status}")
+                    logger.warning(f"Failed to fetch {feed_config.name}: HTTP {response.status}")
                     return []
                 
                 content = await response.text()
                 feed = feedparser.parse(content)
                 
                 if not feed.entries:
-                    logger.warning(f"No entries found in {feed_config['name']}")
+                    logger.warning(f"No entries found in {feed_config.name}")
                     return []
                 
                 articles = []
@@ -80,22 +92,22 @@ class NewsFetcher:
                         logger.error(f"Error parsing entry: {e}")
                         continue
                 
-                logger.info(f"Fetched {len(articles)} articles from {feed_config['name']}")
+                logger.info(f"Fetched {len(articles)} articles from {feed_config.name}")
                 return articles
                 
         except Exception as e:
-            logger.error(f"Error fetching {feed_config['name']}: {e}")
+            logger.error(f"Error fetching {feed_config.name}: {e}")
             return []
     
-    async def parse_feed_entry(self, entry, feed_config: Dict[str, str]) -> Article:
-        """Parse a single RSS feed entry into Article object."""
+    async def parse_feed_entry(self, entry, feed_config: FeedSpec) -> Dict[str, Any]:
+        """Parse a single RSS feed entry into an Article row for bulk_upsert."""
         # Get URL
         url = entry.link if hasattr(entry, 'link') else ''
         if not url:
             return None
         
         # Check if article already exists
-        existing = self.db.query(Article).filter(Article.url == url).first()
+        existing = self.db.execute(ARTICLE_ID_BY_URL, {'url': url}).scalar_one_or_none()
         if existing:
             return None
         
@@ -116,39 +128,33 @@ class NewsFetcher:
         # Fetch full content using newspaper3k
         content = await self._fetch_full_content(url)
         
-        # Get or create category
-        category_name = feed_config.get('category', 'General')
-        category = self.db.query(Category).filter(Category.name == category_name).first()
-        if not category:
-            category = Category(name=category_name, description=f"{category_name} news")
-            self.db.add(category)
-            self.db.commit()
-            self.db.refresh(category)
-        
-        # Create article
-        article = Article(
-            title=title[:500],
-            description=description[:1000] if description else '',
-            url=url[:500],
-            url_to_image=image_url[:500] if image_url else None,
-            published_at=published_at,
-            content=content[:10000] if content else '',
-            category_id=category.id,
-            source=feed_config['name'],
-            author=entry.author if hasattr(entry, 'author') else feed_config['name'],
-            language=feed_config['language'],
-            is_fetched=True
-        )
-        
-        self.db.add(article)
-        try:
+        # Saved in one batch by fetch_all_news
+        return {
+            'title': title[:500],
+            'description': description[:1000] if description else '',
+            'url': url[:500],
+            'url_to_image': image_url[:500] if image_url else None,
+            'published_at': published_at,
+            'content': content[:10000] if content else '',
+            'category_id': self.category_ids.get(feed_config.category or 'General'),
+            'source': feed_config.name,
+            'author': entry.author if hasattr(entry, 'author') else feed_config.name,
+            'language': feed_config.language
+        }
+    
+    def _resolve_category_ids(self, names) -> Dict[str, int]:
+        """Map category names to ids with one IN query, creating any that are missing."""
+        stmt = select(Category.name, Category.id).where(Category.name.in_(names))
+        category_ids = dict(self.db.execute(stmt).all())
+        
+        missing = set(names) - category_ids.keys()
+        if missing:
+            self.db.add_all(
+                Category(name=name, description=f"{name} news") for name in missing
+            )
             self.db.commit()
-            self.db.refresh(article)
-            return article
-        except Exception as e:
-            logger.error(f"Error saving article: {e}")
-            self.db.rollback()
-            return None
+            category_ids = dict(self.db.execute(stmt).all())
+        return category_ids
     
     def _parse_date(self, entry):
         """Parse date from feed entry."""
@@ -3,8 +3,10 @@ Custom middleware for the Globe News application.
 """
 import time
 import json
+import threading
 from typing import Callable
-from fastapi import Request, Response
+from cachetools import TTLCache
+from fastapi import Response
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
@@ -21,26 +23,26 @@ class RequestLoggingMiddleware:
         if scope["type"] != "http":
             return await self.app(scope, receive, send)
         
-        request = Request(scope, receive)
+        # Skip the bookkeeping entirely when access logging is disabled
+        if not logger.isEnabledFor(logging.INFO):
+            return await self.app(scope, receive, send)
         
-        # Log request
+        # Read straight from the ASGI scope instead of building a Request
         start_time = time.time()
-        client_ip = request.client.host if request.client else "unknown"
-        method = request.method
-        url = request.url.path
-        query_params = str(request.query_params)
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        method = scope["method"]
+        url = scope["path"]
+        query_params = scope["query_string"].decode("latin-1")
         
-        logger.info(f"Request: {method} {url}?{query_params} from {client_ip}")
+        logger.info("Request: %s %s?%s from %s", method, url, query_params, client_ip)
         
         # Process request
         async def send_wrapper(message):
             if message["type"] == "http.response.start":
-                status_code = message["status"]
-                process_time = time.time() - start_time
-                
                 logger.info(
-                    f"Response: {method} {url} - Status: {status_code} - "
-                    f"Time: {process_time:.3f}s"
+                    "Response: %s %s - Status: %d - Time: %.3fs",
+                    method, url, message["status"], time.time() - start_time
                 )
             
             await send(message)
@@ -49,44 +51,45 @@ class RequestLoggingMiddleware:
 
 
 class RateLimitMiddleware:
-    """Simple rate limiting middleware."""
+    """Simple rate limiting middleware (token bucket per client IP)."""
     
     def __init__(self, app, requests_per_minute=100):
         self.app = app
         self.requests_per_minute = requests_per_minute
-        self.requests = {}  # Store request counts per IP
+        self.refill_per_second = requests_per_minute / 60.0
+        # ip -> (tokens, last_refill). An idle bucket is full again after a
+        # minute, so letting the cache expire it is equivalent to refilling it.
+        self.buckets = TTLCache(maxsize=100000, ttl=60)
+        self._lock = threading.Lock()
+    
+    def _take_token(self, client_ip: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self.buckets.get(client_ip, (self.requests_per_minute, now))
+            tokens = min(self.requests_per_minute, tokens + (now - last) * self.refill_per_second)
+            if tokens < 1:
+                self.buckets[client_ip] = (tokens, now)
+                return False
+            self.buckets[client_ip] = (tokens - 1, now)
+            return True
     
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
             return await self.app(scope, receive, send)
         
-        request = Request(scope, receive)
-        client_ip = request.client.host if request.client else "unknown"
-        
-        # Clean old entries (more than 1 minute old)
-        current_time = time.time()
-        self.requests = {
-            ip: [(t, count) for t, count in times if current_time - t < 60]
-            for ip, times in self.requests.items()
-        }
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
         
         # Check rate limit
-        if client_ip in self.requests:
-            total_requests = sum(count for _, count in self.requests[client_ip])
-            if total_requests >= self.requests_per_minute:
-                response = Response(
-                    content=json.dumps({
-                        "detail": "Rate limit exceeded. Please try again later."
-                    }),
-                    status_code=429,
-                    media_type="application/json"
-                )
-                await response(scope, receive, send)
-                return
-        
-        # Add request to tracking
-        if client_ip not in self.requests:
-            self.requests[client_ip] = []
-        self.requests[client_ip].append((current_time, 1))
+        if not self._take_token(client_ip):
+            response = Response(
+                content=json.dumps({
+                    "detail": "Rate limit exceeded. Please try again later."
+                }),
+                status_code=429,
+                media_type="application/json"
+            )
+            await response(scope, receive, send)
+            return
         
-        await self.app(scope, receive, send)
\ No newline at end of file
+        await self.app(scope, receive, send)
@@ -2,7 +2,7 @@
 Database Configuration for Globe News
 Includes admin approval fields for AdSense compliance
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -15,13 +15,33 @@ logger = logging.getLogger(__name__)
 DB_PATH = os.environ.get('DB_PATH', '/app/data/globe_news.db')
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+# Pool sized for the fetcher and API sharing one process; tune per worker count
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '20'))
+DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '20'))
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False},
+    connect_args={"check_same_thread": False, "timeout": 30},
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=3600,
+    pool_pre_ping=True,
+    insertmanyvalues_page_size=1000,
+    query_cache_size=1200,
     echo=False
 )
 
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+    """WAL lets API reads run while the fetcher is writing."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -37,10 +57,44 @@ def get_db() -> Generator:
 def init_db():
     """Initialize database - create tables if they don't exist."""
     try:
-        # Import models here to avoid circular imports
-        from app.minimal_models import Base as ModelsBase
-        ModelsBase.metadata.create_all(bind=engine)
+        # Import models here to avoid circular imports; importing registers
+        # them on Base
+        import app.models.minimal_models  # noqa: F401
+        Base.metadata.create_all(bind=engine)
+        # create_all skips existing tables, so make sure their indexes exist too
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(bind=engine, checkfirst=True)
+                except Exception as e:
+                    logger.warning(f"Could not create index {index.name}: {e}")
         logger.info(f"Database initialized at {DB_PATH}")
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
         raise
+    
+    try:
+        backfill_article_source_ids()
+    except Exception as e:
+        logger.warning(f"Skipping source_id backfill: {e}")
+
+def backfill_article_source_ids() -> int:
+    """Link unlinked articles to news_sources by their denormalized source name.
+    
+    Names with no news_sources row yet are registered first. Only rows with a
+    NULL source_id are touched, so after the first run this is a small index
+    scan. Returns how many sources were added.
+    """
+    with engine.begin() as conn:
+        added = conn.execute(text(
+            "INSERT INTO news_sources (name, is_active) "
+            "SELECT DISTINCT source, 1 FROM articles "
+            "WHERE source_id IS NULL AND source IS NOT NULL AND source != '' "
+            "AND source NOT IN (SELECT name FROM news_sources)"
+        )).rowcount
+        conn.execute(text(
+            "UPDATE articles SET source_id = "
+            "(SELECT id FROM news_sources WHERE news_sources.name = articles.source) "
+            "WHERE source_id IS NULL AND source IS NOT NULL"
+        ))
+    return added
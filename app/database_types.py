@@ -30,14 +30,21 @@ class UUID(TypeDecorator):
 class CompatibleUUID(types.TypeDecorator):
     """
     Compatible UUID type that works with both SQLite and PostgreSQL.
-    Stores as CHAR(36) in SQLite and UUID in PostgreSQL.
+    Stores as CHAR(36) in SQLite and native 16-byte UUID in PostgreSQL.
     """
     impl = types.String(36)
     cache_ok = True
 
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(types.String(36))
+
     def process_bind_param(self, value, dialect):
         if value is None:
             return value
+        if dialect.name == "postgresql":
+            return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
         if isinstance(value, uuid.UUID):
             return str(value)
         return value
@@ -51,35 +58,20 @@ class CompatibleUUID(types.TypeDecorator):
 class CompatibleJSON(types.TypeDecorator):
     """
     Compatible JSON type.
+    Native JSONB on PostgreSQL (decoded by the driver), JSON elsewhere.
     """
-    impl = types.Text
+    impl = types.JSON
     cache_ok = True
 
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return None
-        return json.dumps(value)
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return None
-        return json.loads(value)
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.JSONB())
+        return dialect.type_descriptor(types.JSON())
 
 
-class CompatibleArray(types.TypeDecorator):
+class CompatibleArray(CompatibleJSON):
     """
-    Compatible Array type for SQLite.
-    Stores arrays as JSON strings.
+    Compatible Array type.
+    Lists are stored as JSONB/JSON, so they round-trip without json.loads here.
     """
-    impl = types.Text
     cache_ok = True
-
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return None
-        return json.dumps(value)
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return None
-        return json.loads(value)
\ No newline at end of file
@@ -1,5 +1,5 @@
-# Export the models with proper names - REMOVED Source
-from app.models.minimal_models import Article, Category
+# Export the models with proper names
+from app.models.minimal_models import Article, ArticleStatus, Category, NewsSource
 
 # Keep backward compatibility
 NewsArticle = Article
@@ -10,7 +10,9 @@ MinimalCategory = Category
 
 __all__ = [
     'Article',
+    'ArticleStatus',
     'Category',
+    'NewsSource',
     'NewsArticle',
     'MinimalArticle',
     'MinimalCategory'
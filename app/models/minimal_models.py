@@ -1,22 +1,40 @@
 """
 Minimal Models for Globe News - MATCHING OLD DATABASE SCHEMA (2480 articles)
+
+These are the canonical model definitions; app.models.article and
+app.models.models re-export them so every module maps onto the single
+Base from app.database.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy import Computed, Integer, SmallInteger, String, Text, DateTime, Boolean, ForeignKey, Index, JSON, bindparam, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql import func
+from sqlalchemy.orm import load_only, relationship, selectinload, synonym, Mapped, mapped_column, Session
 from datetime import datetime
-from typing import Optional, List
+from enum import IntEnum
+from itertools import islice
+from typing import Optional, List, Iterable
+
+from app.database import Base
+
+
+def _text(length: int):
+    """TEXT everywhere (no length check), VARCHAR(length) on MySQL where it matters."""
+    return Text().with_variant(String(length), "mysql")
 
-Base = declarative_base()
+class ArticleStatus(IntEnum):
+    """Review state stored in articles.status"""
+    PENDING = 0
+    APPROVED = 1
+    REJECTED = 2
 
 class Category(Base):
     __tablename__ = "categories"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(_text(100), unique=True, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     
     # Fixed relationship to match the back_populates in Article
     articles: Mapped[List["Article"]] = relationship("Article", back_populates="category")
@@ -28,32 +46,49 @@ class Category(Base):
 class Article(Base):
     __tablename__ = "articles"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    title: Mapped[str] = mapped_column(_text(500), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Core content fields
     content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     full_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     preview_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # RSS summary
+    summary: Mapped[Optional[str]] = synonym("description")  # legacy name for the RSS summary
+    # Computed by SQLite on read; never assigned by the app
+    content_length: Mapped[Optional[int]] = mapped_column(
+        Integer, Computed("length(COALESCE(NULLIF(full_content, ''), content, ''))", persisted=False)
+    )
     
     # ===== NEW FIELD FOR HUMAN SUMMARIES =====
     human_summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Editor-written summary
     # ==========================================
     
+    # Human summary if available, otherwise preview_content or summary.
+    # Generated by SQLite; deferred so only views that show it select it.
+    display_summary: Mapped[Optional[str]] = mapped_column(
+        Text, Computed("COALESCE(NULLIF(human_summary, ''), NULLIF(preview_content, ''), description)", persisted=False), deferred=True
+    )
+    
+    # AI summary paragraphs as one JSON list. Deferred so list pages that
+    # only need titles don't load them.
+    ai_summaries: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True, deferred=True)
+    ai_summary_generated: Mapped[bool] = mapped_column(Boolean, default=False)
+    ai_summary_generated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    
     # Article metadata
-    url: Mapped[str] = mapped_column(String(1000), nullable=False, unique=True)
-    url_to_image: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
-    thumbnail_url: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
+    url: Mapped[str] = mapped_column(_text(1000), nullable=False, unique=True)
+    url_to_image: Mapped[Optional[str]] = mapped_column(_text(1000), nullable=True)
+    thumbnail_url: Mapped[Optional[str]] = synonym("url_to_image")
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    author: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    author: Mapped[Optional[str]] = mapped_column(_text(200), nullable=True)
     
     # Foreign key
     category_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("categories.id"), nullable=True)
     
-    # Source info
-    source: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    # Source info - the name is denormalized for rows without source_id
+    source: Mapped[Optional[str]] = mapped_column(_text(200), nullable=True)
+    source_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("news_sources.id"), nullable=True, index=True)
     
     # Language & status
     language: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, default='en')
@@ -62,63 +97,165 @@ class Article(Base):
     # Performance tracking fields
     read_time: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     fetch_count: Mapped[int] = mapped_column(Integer, default=0)
+    view_count: Mapped[int] = mapped_column(Integer, default=0)  # flushed in batches by main.py
     last_fetched: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     content_fetched: Mapped[bool] = mapped_column(Boolean, default=False)
     fetch_attempts: Mapped[int] = mapped_column(Integer, default=0)
     last_fetch_attempt: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     
     # ========== ADMIN APPROVAL FIELDS ==========
-    is_approved: Mapped[bool] = mapped_column(Boolean, default=False)
-    is_rejected: Mapped[bool] = mapped_column(Boolean, default=False)
-    is_edited: Mapped[bool] = mapped_column(Boolean, default=False)
+    status: Mapped[int] = mapped_column(SmallInteger, default=ArticleStatus.PENDING)
     
     approved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    approved_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    approved_by: Mapped[Optional[str]] = mapped_column(_text(100), nullable=True)
     rejected_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    rejected_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    rejected_by: Mapped[Optional[str]] = mapped_column(_text(100), nullable=True)
     edited_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    edited_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    edited_by: Mapped[Optional[str]] = mapped_column(_text(100), nullable=True)
     
     editor_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Relationships - Fixed to match Category's back_populates
     category: Mapped[Optional["Category"]] = relationship("Category", back_populates="articles")
     
+    # Indexes - names match the ones created by init_database() in main.py
+    __table_args__ = (
+        Index('idx_articles_language', 'language'),
+        Index('idx_articles_published', 'published_at'),
+        Index('idx_articles_source', 'source'),
+        # Feeds and review queues: one status, newest first
+        Index('idx_articles_status', 'status', 'published_at'),
+        # Admin approved list, most recently approved first
+        Index('idx_articles_status_approved', 'status', 'approved_at'),
+        # Public feed filtered by language
+        Index('idx_articles_feed', 'status', 'language', 'published_at'),
+        # Category pages and related articles; also covers category_id lookups
+        Index('idx_articles_cat_pub', 'category_id', 'published_at'),
+    )
+    
     @property
     def image_url(self):
-        return self.url_to_image or self.thumbnail_url
+        return self.url_to_image
+    
+    @image_url.setter
+    def image_url(self, value):
+        self.url_to_image = value
+    
+    @property
+    def is_approved(self):
+        return self.status == ArticleStatus.APPROVED
+    
+    @property
+    def is_rejected(self):
+        return self.status == ArticleStatus.REJECTED
+    
+    @property
+    def is_edited(self):
+        return self.edited_at is not None
     
     @property
     def is_public(self):
-        return self.is_approved and not self.is_rejected
+        return self.status == ArticleStatus.APPROVED
+    
+    @property
+    def summary_paragraphs(self):
+        return self.ai_summaries or []
     
     @property
     def category_name(self):
         return self.category.name if self.category else None
     
-    @property
-    def display_summary(self):
-        """Returns human summary if available, otherwise falls back to preview_content or summary"""
-        if self.human_summary:
-            return self.human_summary
-        elif self.preview_content:
-            return self.preview_content
-        else:
-            return self.summary
+    @classmethod
+    def bulk_upsert(cls, session: Session, rows: Iterable[dict], batch_size: int = 1000) -> int:
+        """Insert article rows in batches, skipping URLs that already exist.
+        
+        rows may be a generator; only one batch is held in memory. Every row
+        must have the same keys. Returns the number of rows inserted.
+        """
+        stmt = sqlite_insert(cls).on_conflict_do_nothing(index_elements=['url'])
+        # Executed on the session's connection as a Core executemany: the ORM
+        # bulk path returns a result without rowcount
+        connection = session.connection()
+        rows = iter(rows)
+        inserted = 0
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            result = connection.execute(stmt, batch)
+            inserted += max(result.rowcount, 0)
+        return inserted
     
     def __repr__(self):
         return f"<Article {self.title[:50]}...>"
 
 
+class NewsSource(Base):
+    __tablename__ = "news_sources"
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(_text(200), nullable=False)
+    url: Mapped[Optional[str]] = mapped_column(_text(500), nullable=True)
+    language: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    category: Mapped[Optional[str]] = mapped_column(_text(100), nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    last_fetched: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    
+    def __repr__(self):
+        return f"<NewsSource {self.name}>"
+
+
+# Prebuilt statements for hot lookups. The bindparam() placeholders keep a
+# single cached compiled form per statement. List statements selectin-load
+# the category so templates reading category_name don't issue N+1 queries.
+ARTICLE_ID_BY_URL = select(Article.id).where(Article.url == bindparam('url')).limit(1)
+
+RELATED_ARTICLES = (
+    select(Article)
+    .options(selectinload(Article.category))
+    .where(
+        Article.category_id == bindparam('category_id'),
+        Article.id != bindparam('article_id'),
+        Article.language == bindparam('language'),
+    )
+    .order_by(Article.published_at.desc())
+    .limit(bindparam('n'))
+)
+
+APPROVED_ARTICLES_PAGE = (
+    select(Article)
+    .options(
+        selectinload(Article.category),
+        # Only what the admin list renders; the text bodies stay unloaded
+        load_only(
+            Article.title, Article.source, Article.category_id, Article.approved_at,
+            Article.approved_by, Article.view_count,
+        ),
+    )
+    .where(Article.status == ArticleStatus.APPROVED)
+    .order_by(Article.approved_at.desc())
+    .offset(bindparam('skip'))
+    .limit(bindparam('n'))
+)
+
+
 # For backward compatibility
 NewsArticle = Article
+Source = NewsSource
 
 __all__ = [
     'Base',
     'Article',
+    'ArticleStatus',
     'Category',
-    'NewsArticle'
+    'NewsSource',
+    'NewsArticle',
+    'Source',
+    'ARTICLE_ID_BY_URL',
+    'RELATED_ARTICLES',
+    'APPROVED_ARTICLES_PAGE'
 ]
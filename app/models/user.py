@@ -1,15 +1,108 @@
 from datetime import datetime, timedelta
-import json
+import orjson
 import secrets
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import sqlite3
 import hashlib
+import hmac
+import threading
+import time
+from cachetools import TTLCache
 import jwt
 from auth_config import AuthConfig
 
+
+# scrypt cost for local passwords; stored with each hash so it can be raised later
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2 ** 14, 8, 1
+
+
+def hash_password(password: str) -> str:
+    """Hash a password as scrypt$n$r$p$salt$hash."""
+    salt = secrets.token_bytes(16)
+    hashed = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+    return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${hashed.hex()}"
+
+
+def check_password(password: str, password_hash: str) -> bool:
+    """Check a password against an scrypt hash or a legacy salt$sha256 hash."""
+    parts = password_hash.split('$')
+    if parts[0] == 'scrypt' and len(parts) == 6:
+        n, r, p = (int(x) for x in parts[1:4])
+        hashed = hashlib.scrypt(password.encode(), salt=bytes.fromhex(parts[4]), n=n, r=r, p=p)
+        return hmac.compare_digest(hashed.hex(), parts[5])
+    if len(parts) == 2:
+        salt, stored_hash = parts
+        test_hash = hashlib.sha256((password + salt).encode()).hexdigest()
+        return hmac.compare_digest(test_hash, stored_hash)
+    return False
+
+
+# sessions.session_id is already UNIQUE. The unique (email, auth_provider) and
+# (user_id, article_id) indexes back the lookups and the INSERT OR IGNORE dedup
+# in add_bookmark(s); the rest cover range/sort queries.
+_USER_INDEXES = (
+    'CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email_provider ON users(email, auth_provider)',
+    'CREATE UNIQUE INDEX IF NOT EXISTS idx_bookmarks_user_article ON bookmarks(user_id, article_id)',
+    'CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions(expires_at)',
+    'CREATE INDEX IF NOT EXISTS idx_bookmarks_user_created ON bookmarks(user_id, created_at)',
+)
+_indexes_ready = False
+
+
+def ensure_indexes(conn: sqlite3.Connection):
+    """Create the user-table indexes once per process.
+    
+    Skipped while the connection has a transaction open, so committing the DDL
+    never commits the caller's pending writes.
+    """
+    global _indexes_ready
+    if _indexes_ready or conn.in_transaction:
+        return
+    try:
+        for statement in _USER_INDEXES:
+            try:
+                conn.execute(statement)
+            except sqlite3.IntegrityError as e:
+                # Existing duplicate rows; the remaining indexes still apply
+                print(f"Skipping user index: {e}")
+        conn.commit()
+        _indexes_ready = True
+    except sqlite3.OperationalError as e:
+        # Tables not created yet; try again with the next connection
+        conn.rollback()
+        print(f"Skipping user indexes: {e}")
+
+
+# Hot-path statements, kept as constants so every call hits the connection's
+# statement cache with the same SQL text.
+_SQL_USER_BY_EMAIL = 'SELECT * FROM users WHERE email = ? AND auth_provider = ?'
+_SQL_USER_BY_ID = 'SELECT * FROM users WHERE id = ?'
+_SQL_GET_SESSION = '''
+SELECT s.session_id, s.user_id, s.expires_at,
+       u.email, u.username, u.display_name, u.is_admin
+FROM sessions s
+JOIN users u ON s.user_id = u.id
+WHERE s.session_id = ? AND s.expires_at > ?
+'''
+_SQL_GET_SESSION_DATA = 'SELECT data FROM sessions WHERE session_id = ? AND expires_at > ?'
+_SQL_IS_BOOKMARKED = 'SELECT 1 FROM bookmarks WHERE user_id = ? AND article_id = ?'
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply WAL and cache PRAGMAs and the Row factory. Safe to call repeatedly."""
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-64000')  # 64 MB
+    conn.execute('PRAGMA mmap_size=268435456')  # 256 MB
+    conn.row_factory = sqlite3.Row
+    ensure_indexes(conn)
+    return conn
+
+
 class User:
     def __init__(self, db_conn: sqlite3.Connection):
-        self.conn = db_conn
+        self.conn = configure_connection(db_conn)
         self.cursor = db_conn.cursor()
     
     def create_user(self, email: str, username: str = None, display_name: str = None,
@@ -20,10 +113,10 @@ class User:
             # Hash password if provided
             password_hash = None
             if password and auth_provider == 'local':
-                salt = secrets.token_hex(16)
-                hashed = hashlib.sha256((password + salt).encode()).hexdigest()
-                password_hash = f"{salt}${hashed}"
+                password_hash = hash_password(password)
             
+            now = datetime.now()
+            local_part = email.split('@')[0]
             self.cursor.execute('''
             INSERT INTO users (email, username, display_name, avatar_url, 
                               auth_provider, provider_id, password_hash, 
@@ -31,14 +124,14 @@ class User:
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 email,
-                username or email.split('@')[0],
-                display_name or email.split('@')[0],
+                username or local_part,
+                display_name or local_part,
                 avatar_url,
                 auth_provider,
                 provider_id,
                 password_hash,
-                datetime.now(),
-                datetime.now()
+                now,
+                now
             ))
             
             user_id = self.cursor.lastrowid
@@ -54,10 +147,7 @@ class User:
     def get_user_by_email(self, email: str, auth_provider: str = 'local') -> Optional[Dict]:
         """Get user by email and auth provider."""
         try:
-            self.cursor.execute(
-                'SELECT * FROM users WHERE email = ? AND auth_provider = ?',
-                (email, auth_provider)
-            )
+            self.cursor.execute(_SQL_USER_BY_EMAIL, (email, auth_provider))
             user = self.cursor.fetchone()
             return dict(user) if user else None
         except Exception as e:
@@ -67,7 +157,7 @@ class User:
     def get_user_by_id(self, user_id: int) -> Optional[Dict]:
         """Get user by ID."""
         try:
-            self.cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
+            self.cursor.execute(_SQL_USER_BY_ID, (user_id,))
             user = self.cursor.fetchone()
             return dict(user) if user else None
         except Exception as e:
@@ -80,11 +170,13 @@ class User:
         if not user or not user.get('password_hash'):
             return None
         
-        salt, stored_hash = user['password_hash'].split('$')
-        test_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-        
-        if test_hash == stored_hash:
-            # Update last login
+        if check_password(password, user['password_hash']):
+            # Update last login, upgrading a legacy SHA-256 hash while we have the password
+            if not user['password_hash'].startswith('scrypt$'):
+                self.cursor.execute(
+                    'UPDATE users SET password_hash = ? WHERE id = ?',
+                    (hash_password(password), user['id'])
+                )
             self.cursor.execute(
                 'UPDATE users SET last_login = ? WHERE id = ?',
                 (datetime.now(), user['id'])
@@ -101,7 +193,7 @@ class User:
             
             self.cursor.execute(
                 'UPDATE users SET preferences = ? WHERE id = ?',
-                (json.dumps(current_prefs), user_id)
+                (orjson.dumps(current_prefs).decode(), user_id)
             )
             self.conn.commit()
             return True
@@ -118,7 +210,7 @@ class User:
             )
             result = self.cursor.fetchone()
             if result and result['preferences']:
-                return json.loads(result['preferences'])
+                return orjson.loads(result['preferences'])
             return {}
         except Exception as e:
             print(f"Error getting preferences: {e}")
@@ -154,9 +246,17 @@ class User:
         self.conn.commit()
         return user if user else None
 
+# session_id -> session row joined with its user. Shared across SessionManager
+# instances, which are created per connection. Sessions that expire within the
+# TTL are never cached, so a hit is always still valid.
+SESSION_CACHE_TTL = 60
+_session_cache = TTLCache(maxsize=10000, ttl=SESSION_CACHE_TTL, timer=time.monotonic)
+_session_cache_lock = threading.Lock()
+
+
 class SessionManager:
     def __init__(self, db_conn: sqlite3.Connection):
-        self.conn = db_conn
+        self.conn = configure_connection(db_conn)
         self.cursor = db_conn.cursor()
     
     def create_session(self, user_id: int, data: Dict = None) -> str:
@@ -170,7 +270,7 @@ class SessionManager:
         ''', (
             session_id,
             user_id,
-            json.dumps(data or {}),
+            orjson.dumps(data or {}).decode(),
             expires_at
         ))
         self.conn.commit()
@@ -178,24 +278,46 @@ class SessionManager:
     
     def get_session(self, session_id: str) -> Optional[Dict]:
         """Get session by ID if not expired."""
+        with _session_cache_lock:
+            cached = _session_cache.get(session_id)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            self.cursor.execute('''
-            SELECT s.*, u.email, u.username, u.display_name, u.is_admin
-            FROM sessions s
-            JOIN users u ON s.user_id = u.id
-            WHERE s.session_id = ? AND s.expires_at > ?
-            ''', (session_id, datetime.now()))
+            now = datetime.now()
+            self.cursor.execute(_SQL_GET_SESSION, (session_id, now))
             
             session = self.cursor.fetchone()
             if session:
-                return dict(session)
+                session = dict(session)
+                expires_at = session['expires_at']
+                if isinstance(expires_at, str):
+                    expires_at = datetime.fromisoformat(expires_at)
+                if expires_at - now > timedelta(seconds=SESSION_CACHE_TTL):
+                    with _session_cache_lock:
+                        _session_cache[session_id] = dict(session)
+                return session
             return None
         except Exception as e:
             print(f"Error getting session: {e}")
             return None
     
+    def get_session_data(self, session_id: str) -> Optional[Dict]:
+        """Get the JSON data stored with a session if not expired."""
+        try:
+            self.cursor.execute(_SQL_GET_SESSION_DATA, (session_id, datetime.now()))
+            row = self.cursor.fetchone()
+            if row:
+                return orjson.loads(row['data'] or '{}')
+            return None
+        except Exception as e:
+            print(f"Error getting session data: {e}")
+            return None
+    
     def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
+        with _session_cache_lock:
+            _session_cache.pop(session_id, None)
         try:
             self.cursor.execute(
                 'DELETE FROM sessions WHERE session_id = ?',
@@ -223,7 +345,7 @@ class SessionManager:
 
 class BookmarkManager:
     def __init__(self, db_conn: sqlite3.Connection):
-        self.conn = db_conn
+        self.conn = configure_connection(db_conn)
         self.cursor = db_conn.cursor()
     
     def add_bookmark(self, user_id: int, article_id: int) -> bool:
@@ -239,6 +361,23 @@ class BookmarkManager:
             print(f"Error adding bookmark: {e}")
             return False
     
+    def add_bookmarks_bulk(self, user_id: int, article_ids: List[int]) -> int:
+        """Add several articles to user's bookmarks in one transaction.
+        
+        Returns the number of new bookmarks; existing ones are ignored.
+        """
+        try:
+            self.cursor.executemany('''
+            INSERT OR IGNORE INTO bookmarks (user_id, article_id)
+            VALUES (?, ?)
+            ''', [(user_id, article_id) for article_id in article_ids])
+            self.conn.commit()
+            return self.cursor.rowcount
+        except Exception as e:
+            print(f"Error adding bookmarks: {e}")
+            self.conn.rollback()
+            return 0
+    
     def remove_bookmark(self, user_id: int, article_id: int) -> bool:
         """Remove article from user's bookmarks."""
         try:
@@ -251,30 +390,48 @@ class BookmarkManager:
             print(f"Error removing bookmark: {e}")
             return False
     
-    def get_user_bookmarks(self, user_id: int, limit: int = 50, offset: int = 0) -> list:
-        """Get user's bookmarked articles."""
+    def get_user_bookmarks(self, user_id: int, limit: int = 50, cursor: Optional[str] = None) -> Dict:
+        """Get a page of user's bookmarked articles, newest first.
+        
+        Returns {"bookmarks": [...], "next_cursor": ...}; pass `next_cursor` back
+        as `cursor` for the following page (None on the last page). The cursor
+        carries the bookmark id too, since bulk-added bookmarks share a created_at.
+        """
         try:
-            self.cursor.execute('''
-            SELECT a.*, b.created_at as bookmarked_at
-            FROM articles a
-            JOIN bookmarks b ON a.id = b.article_id
-            WHERE b.user_id = ?
-            ORDER BY b.created_at DESC
-            LIMIT ? OFFSET ?
-            ''', (user_id, limit, offset))
+            if cursor:
+                created_at, _, bookmark_id = cursor.rpartition('|')
+                self.cursor.execute('''
+                SELECT a.*, b.created_at as bookmarked_at, b.id as bookmark_id
+                FROM articles a
+                JOIN bookmarks b ON a.id = b.article_id
+                WHERE b.user_id = ? AND (b.created_at, b.id) < (?, ?)
+                ORDER BY b.created_at DESC, b.id DESC
+                LIMIT ?
+                ''', (user_id, created_at, int(bookmark_id), limit))
+            else:
+                self.cursor.execute('''
+                SELECT a.*, b.created_at as bookmarked_at, b.id as bookmark_id
+                FROM articles a
+                JOIN bookmarks b ON a.id = b.article_id
+                WHERE b.user_id = ?
+                ORDER BY b.created_at DESC, b.id DESC
+                LIMIT ?
+                ''', (user_id, limit))
             
-            return [dict(row) for row in self.cursor.fetchall()]
+            bookmarks = [dict(row) for row in self.cursor.fetchall()]
+            next_cursor = None
+            if len(bookmarks) == limit:
+                last = bookmarks[-1]
+                next_cursor = f"{last['bookmarked_at']}|{last['bookmark_id']}"
+            return {"bookmarks": bookmarks, "next_cursor": next_cursor}
         except Exception as e:
             print(f"Error getting bookmarks: {e}")
-            return []
+            return {"bookmarks": [], "next_cursor": None}
     
     def is_bookmarked(self, user_id: int, article_id: int) -> bool:
         """Check if article is bookmarked by user."""
         try:
-            self.cursor.execute('''
-            SELECT 1 FROM bookmarks 
-            WHERE user_id = ? AND article_id = ?
-            ''', (user_id, article_id))
+            self.cursor.execute(_SQL_IS_BOOKMARKED, (user_id, article_id))
             return self.cursor.fetchone() is not None
         except Exception as e:
             print(f"Error checking bookmark: {e}")
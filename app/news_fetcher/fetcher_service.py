@@ -2,27 +2,38 @@
 Main fetcher service that coordinates RSS and API fetching
 """
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, select, update
 
 from .rss_fetcher import RSSFetcher
 from .sources_manager import NewsSourcesManager
 from .api_fetcher import APIFetcher
 from ..models.minimal_models import Article, Source, Category
+from ..core.caches import invalidate_sources_cache
 from ..database import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+# How far back the duplicate check looks for matching URLs and titles
+DUPLICATE_LOOKBACK_DAYS = 7
+
 class NewsFetcherService:
     """Main service for fetching and storing news"""
     
     def __init__(self, db: Session = None):
-        self.db = db or SessionLocal()
+        # Without an injected session, each fetch run checks out its own
+        # session so the pooled connection is returned between runs
+        self._owns_session = db is None
+        self.db = db
         self.rss_fetcher = RSSFetcher()
         self.sources_manager = NewsSourcesManager()
         self.api_fetcher = APIFetcher()
+        self._seen_urls = set()
+        self._seen_title_prefixes = set()
+        self._source_ids: Dict[str, int] = {}
+        self._category_ids: Dict[str, int] = {}
         
     def fetch_and_store_news(self, max_articles: int = 100) -> Dict:
         """
@@ -48,6 +59,8 @@ class NewsFetcherService:
         }
         
         start_time = datetime.utcnow()
+        if self._owns_session:
+            self.db = SessionLocal()
         
         try:
             # Step 1: Fetch from RSS feeds
@@ -61,24 +74,38 @@ class NewsFetcherService:
             results["api_articles"] = len(api_articles)
             all_articles.extend(api_articles)
             
+            # Drop copies of the same URL syndicated across feeds, keeping the first
+            unique_articles = {}
+            for article_data in all_articles:
+                if article_data.get("url"):
+                    unique_articles.setdefault(article_data["url"], article_data)
+            results["duplicates_skipped"] = len(all_articles) - len(unique_articles)
+            all_articles = list(unique_articles.values())
+            
             # Step 3: Ensure sources and categories exist
             self._ensure_sources_and_categories(all_articles)
             
-            # Step 4: Filter duplicates and store new articles
-            new_articles_added = 0
+            # Step 4: Filter duplicates and store new articles in one batch
+            self._load_seen_articles()
+            rows = []
             for article_data in all_articles[:max_articles]:
                 try:
                     if self._is_duplicate_article(article_data):
                         results["duplicates_skipped"] += 1
                         continue
                     
-                    if self._store_article(article_data):
-                        new_articles_added += 1
+                    row = self._build_article_row(article_data)
+                    if row:
+                        rows.append(row)
+                        self._seen_urls.add(article_data["url"])
+                        self._seen_title_prefixes.add(article_data["title"][:50].lower())
                         
                 except Exception as e:
                     logger.error(f"Error processing article '{article_data.get('title', 'Unknown')}': {e}")
                     continue
             
+            new_articles_added = Article.bulk_upsert(self.db, rows)
+            self.db.commit()
             results["new_articles_added"] = new_articles_added
             
             # Step 5: Update trending/breaking status
@@ -103,14 +130,12 @@ class NewsFetcherService:
             self.db.rollback()
             raise
         finally:
-            if not self.db:
+            if self._owns_session:
                 self.db.close()
+                self.db = None
     
     def _ensure_sources_and_categories(self, articles: List[Dict]):
-        """Ensure all sources and categories exist in database"""
-        sources_added = 0
-        categories_added = 0
-        
+        """Ensure all sources and categories exist and cache their ids by name"""
         # Get unique sources and categories
         sources = {}
         categories = set()
@@ -120,144 +145,115 @@ class NewsFetcherService:
             category = article.get("category", "General")
 
             if source_name:
-                sources[source_name] = sources.get(source_name, {
-                    "name": source_name,
-                    "country": article.get("country", "Unknown"),
-                    "language": article.get("language", "en"),
-                    "reliability_score": 7
-                })
+                sources.setdefault(source_name, article.get("language", "en"))
             
             if category:
                 categories.add(category)
         
-        # Add categories
-        for category_name in categories:
-            existing = self.db.query(Category).filter(Category.name == category_name).first()
-            if not existing:
-                category = Category(
-                    name=category_name,
-                    description=f"News about {category_name}"
-                )
-                self.db.add(category)
-                categories_added += 1
+        self._category_ids = dict(self.db.execute(
+            select(Category.name, Category.id).where(Category.name.in_(categories))
+        ).all())
+        self._source_ids = dict(self.db.execute(
+            select(Source.name, Source.id).where(Source.name.in_(sources.keys()))
+        ).all())
         
-        # Add sources
-        for source_data in sources.values():
-            existing = self.db.query(Source).filter(Source.name == source_data["name"]).first()
-            if not existing:
-                source = Source(
-                    name=source_data["name"],
-                    country=source_data["country"],
-                    language=source_data["language"],
-                    reliability_score=source_data["reliability_score"]
-                )
-                self.db.add(source)
-                sources_added += 1
+        new_categories = [
+            Category(name=name, description=f"News about {name}")
+            for name in categories - self._category_ids.keys()
+        ]
+        new_sources = [
+            Source(name=name, language=language)
+            for name, language in sources.items() if name not in self._source_ids
+        ]
         
-        if sources_added or categories_added:
+        if new_categories or new_sources:
+            self.db.add_all(new_categories + new_sources)
+            self.db.flush()  # assigns ids without reloading after commit
+            self._category_ids.update((c.name, c.id) for c in new_categories)
+            self._source_ids.update((s.name, s.id) for s in new_sources)
             self.db.commit()
-            logger.info(f"Added {sources_added} new sources and {categories_added} new categories")
+            if new_sources:
+                invalidate_sources_cache()
+            logger.info(f"Added {len(new_sources)} new sources and {len(new_categories)} new categories")
+    
+    def _load_seen_articles(self):
+        """Load URLs and title prefixes of recent articles in one query"""
+        since = datetime.utcnow() - timedelta(days=DUPLICATE_LOOKBACK_DAYS)
+        rows = self.db.execute(
+            select(Article.url, func.lower(func.substr(Article.title, 1, 50)))
+            .where(Article.published_at > since)
+        ).all()
+        self._seen_urls = {url for url, _ in rows}
+        self._seen_title_prefixes = {prefix for _, prefix in rows}
     
     def _is_duplicate_article(self, article_data: Dict) -> bool:
-        """Check if article already exists in database"""
+        """Check if article was already seen (call _load_seen_articles first)"""
         title = article_data.get("title", "")
         url = article_data.get("url", "")
         
         if not title or not url:
             return True
         
-        # Check by URL (most reliable)
-        existing = self.db.query(Article).filter(Article.url == url).first()
-        if existing:
-            return True
+        return url in self._seen_urls or title[:50].lower() in self._seen_title_prefixes
+    
+    def _build_article_row(self, article_data: Dict) -> Optional[Dict]:
+        """Build an Article.bulk_upsert row (call _ensure_sources_and_categories first)"""
+        source_name = article_data.get("source_name", "")
+        source_id = self._source_ids.get(source_name)
+        if source_id is None:
+            logger.warning(f"Source not found: {source_name}")
+            return None
         
-        # Check by similar title (fuzzy match)
-        existing = self.db.query(Article).filter(
-            Article.title.ilike(f"%{title[:50]}%")
-        ).first()
+        category_name = article_data.get("category", "General")
         
-        return existing is not None
-    
-    def _store_article(self, article_data: Dict) -> bool:
-        """Store article in database"""
-        try:
-            # Get source
-            source_name = article_data.get("source_name", "")
-            source = self.db.query(Source).filter(Source.name == source_name).first()
-            if not source:
-                logger.warning(f"Source not found: {source_name}")
-                return False
-            
-            # Get category
-            category_name = article_data.get("category", "General")
-            category = self.db.query(Category).filter(Category.name == category_name).first()
-            if not category:
-                # Create category if it doesn't exist
-                category = Category(name=category_name, description=f"News about {category_name}")
-                self.db.add(category)
-                self.db.commit()
-            
-            # Create article
-            article = Article(
-                title=article_data["title"],
-                summary=article_data.get("summary", ""),
-                full_content=article_data.get("full_content", ""),
-                url=article_data["url"],
-                image_url=article_data.get("image_url", ""),
-                published_at=article_data.get("published_at", datetime.utcnow()),
-                author=article_data.get("author", ""),
-                source_id=source.id,
-                category_id=category.id,
-                country=article_data.get("country", ""),
-                language=article_data.get("language", "en"),
-                is_trending=article_data.get("is_trending", False),
-                is_breaking=article_data.get("is_breaking", False),
-                view_count=article_data.get("view_count", 0)
-            )
-            
-            self.db.add(article)
-            self.db.commit()
-            
-            logger.debug(f"Stored article: {article_data['title'][:50]}...")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error storing article: {e}")
-            self.db.rollback()
-            return False
+        # Every row carries the same keys, as bulk_upsert requires
+        return {
+            "title": article_data["title"],
+            "description": article_data.get("summary", ""),
+            "full_content": article_data.get("full_content", ""),
+            "url": article_data["url"],
+            "url_to_image": article_data.get("image_url") or None,
+            "published_at": article_data.get("published_at") or datetime.utcnow(),
+            "author": article_data.get("author", ""),
+            "source": source_name,
+            "source_id": source_id,
+            "category_id": self._category_ids.get(category_name),
+            "language": article_data.get("language", "en"),
+            "is_breaking": article_data.get("is_breaking", False)
+        }
     
     def _update_trending_status(self):
-        """Update trending and breaking status based on recency and engagement"""
+        """Update breaking status based on recency.
+        
+        Trending is not stored; the trending endpoint ranks by view_count directly.
+        """
         try:
-            # Mark articles from last 24 hours as potentially trending
-            time_threshold = datetime.utcnow() - timedelta(hours=24)
-            
-            # Reset all trending/breaking flags first
-            self.db.query(Article).update({
-                "is_trending": False,
-                "is_breaking": False
-            })
-            
-            # Mark recent articles with high view counts as trending
-            trending_articles = self.db.query(Article).filter(
-                Article.published_at >= time_threshold,
-                Article.view_count >= 10
-            ).order_by(Article.view_count.desc()).limit(10).all()
-            
-            for article in trending_articles:
-                article.is_trending = True
-            
-            # Mark very recent articles (last 2 hours) as breaking
+            # The five most recent articles from the last 2 hours are breaking
             breaking_threshold = datetime.utcnow() - timedelta(hours=2)
-            breaking_articles = self.db.query(Article).filter(
-                Article.published_at >= breaking_threshold
-            ).order_by(Article.published_at.desc()).limit(5).all()
+            breaking_ids = (
+                select(Article.id)
+                .where(Article.published_at >= breaking_threshold)
+                .order_by(Article.published_at.desc())
+                .limit(5)
+                .scalar_subquery()
+            )
             
-            for article in breaking_articles:
-                article.is_breaking = True
+            # Clear only rows that drop out, rather than rewriting the whole table
+            cleared = self.db.execute(
+                update(Article)
+                .where(Article.is_breaking == True, Article.id.not_in(breaking_ids))
+                .values(is_breaking=False)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            marked = self.db.execute(
+                update(Article)
+                .where(Article.id.in_(breaking_ids))
+                .values(is_breaking=True)
+                .execution_options(synchronize_session=False)
+            ).rowcount
             
             self.db.commit()
-            logger.info(f"Updated {len(trending_articles)} trending and {len(breaking_articles)} breaking articles")
+            logger.info(f"Marked {marked} breaking articles, cleared {cleared}")
             
         except Exception as e:
             logger.error(f"Error updating trending status: {e}")
@@ -265,21 +261,23 @@ class NewsFetcherService:
     
     def get_stats(self) -> Dict:
         """Get database statistics"""
+        db = self.db or SessionLocal()
         try:
-            total_articles = self.db.query(Article).count()
-            total_sources = self.db.query(Source).count()
-            total_categories = self.db.query(Category).count()
-            trending_articles = self.db.query(Article).filter(Article.is_trending == True).count()
-            breaking_articles = self.db.query(Article).filter(Article.is_breaking == True).count()
+            total_articles = db.query(Article).count()
+            total_sources = db.query(Source).count()
+            total_categories = db.query(Category).count()
+            breaking_articles = db.query(Article).filter(Article.is_breaking == True).count()
             
             return {
                 "total_articles": total_articles,
                 "total_sources": total_sources,
                 "total_categories": total_categories,
-                "trending_articles": trending_articles,
                 "breaking_articles": breaking_articles,
                 "latest_fetch": datetime.utcnow().isoformat()
             }
         except Exception as e:
             logger.error(f"Error getting stats: {e}")
-            return {}
\ No newline at end of file
+            return {}
+        finally:
+            if db is not self.db:
+                db.close()
@@ -3,19 +3,40 @@ RSS Feed Fetcher for news articles
 """
 import feedparser
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone
 import html
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ..core.config import FeedSpec
 
 logger = logging.getLogger(__name__)
 
+# Feeds are fetched concurrently; each worker mostly waits on the network
+MAX_FEED_WORKERS = 16
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_IMG_SRC_RE = re.compile(r'<img[^>]+src="([^"]+)"')
+_IMG_FIELDS = (
+    ('media_content', 'url'),  # Media RSS
+    ('media_thumbnail', 'url'),  # Media RSS thumbnail
+    ('enclosures', 'href'),  # Enclosures
+)
+# Deletes control characters other than tab/newline/carriage return
+_CTRL_TABLE = dict.fromkeys(i for i in range(32) if chr(i) not in '\n\r\t')
+
 class RSSFetcher:
     """Fetches and parses RSS feeds from news sources"""
     
     def __init__(self):
         self.feeds_processed = 0
         self.articles_fetched = 0
+        self._stats_lock = threading.Lock()
+        # feed_url -> (ETag, Last-Modified) from the last successful fetch
+        self._etag_cache: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
     
     def parse_feed(self, feed_url: str, source_name: str, category: str = "General") -> List[Dict]:
         """
@@ -32,8 +53,13 @@ class RSSFetcher:
         try:
             logger.info(f"Parsing RSS feed: {source_name} - {feed_url}")
             
-            # Parse the feed
-            feed = feedparser.parse(feed_url)
+            # Conditional GET: unchanged feeds answer 304 with no body to parse
+            etag, modified = self._etag_cache.get(feed_url, (None, None))
+            feed = feedparser.parse(feed_url, etag=etag, modified=modified)
+            
+            if getattr(feed, 'status', None) == 304:
+                logger.info(f"Feed unchanged since last fetch: {source_name}")
+                return []
             
             if feed.bozo:
                 logger.warning(f"Feed parsing issue for {source_name}: {feed.bozo_exception}")
@@ -45,12 +71,15 @@ class RSSFetcher:
                     article = self._parse_entry(entry, source_name, category)
                     if article:
                         articles.append(article)
-                        self.articles_fetched += 1
                 except Exception as e:
                     logger.error(f"Error parsing entry from {source_name}: {e}")
                     continue
             
-            self.feeds_processed += 1
+            self._etag_cache[feed_url] = (feed.get('etag'), feed.get('modified'))
+            
+            with self._stats_lock:
+                self.feeds_processed += 1
+                self.articles_fetched += len(articles)
             logger.info(f"Fetched {len(articles)} articles from {source_name}")
             return articles
             
@@ -62,24 +91,23 @@ class RSSFetcher:
         """Parse a single RSS entry into article format"""
         try:
             # Extract title
-            title = self._clean_text(getattr(entry, 'title', ''))
+            title = self._clean_text(entry.get('title', ''))
             if not title:
                 return None
             
             # Extract content/summary
-            summary = self._clean_text(getattr(entry, 'summary', ''))
+            summary = self._clean_text(entry.get('summary', ''))
             
             # Try to get full content from different fields
             content = ""
-            if hasattr(entry, 'content') and entry.content:
-                # Some feeds have content in content[0].value
-                for item in entry.content:
-                    if hasattr(item, 'value'):
-                        content = self._clean_text(item.value)
-                        break
+            # Some feeds have content in content[0].value
+            for item in entry.get('content') or []:
+                if 'value' in item:
+                    content = self._clean_text(item['value'])
+                    break
             
-            if not content and hasattr(entry, 'description'):
-                content = self._clean_text(entry.description)
+            if not content:
+                content = self._clean_text(entry.get('description', ''))
             
             # Use summary if no content
             if not content and summary:
@@ -89,16 +117,14 @@ class RSSFetcher:
                 summary = content[:200] + "..." if len(content) > 200 else content
             
             # Extract link
-            link = getattr(entry, 'link', '')
+            link = entry.get('link', '')
             if not link:
                 return None
             
             # Extract published date
-            published = None
-            if hasattr(entry, 'published_parsed'):
-                published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            elif hasattr(entry, 'updated_parsed'):
-                published = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
+            parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+            if parsed:
+                published = datetime(*parsed[:6], tzinfo=timezone.utc)
             else:
                 published = datetime.utcnow()
             
@@ -106,14 +132,12 @@ class RSSFetcher:
             image_url = self._extract_image(entry)
             
             # Extract author
-            author = ""
-            if hasattr(entry, 'author'):
-                author = self._clean_text(entry.author)
+            author = self._clean_text(entry.get('author', ''))
             
             # Create article dictionary
             article = {
                 "title": title,
-                "summary": summary[:500] if summary else "",  # Limit summary length
+                "summary": summary if len(summary) <= 500 else summary[:500],  # Limit summary length
                 "full_content": content,
                 "url": link,
                 "image_url": image_url,
@@ -142,66 +166,59 @@ class RSSFetcher:
         text = html.unescape(text)
         
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _TAG_RE.sub(' ', text)
         
-        # Remove control characters
-        text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\r\t')
+        # Remove control characters (single C-level pass)
+        text = text.translate(_CTRL_TABLE)
         
-        return text.strip()
+        # Remove extra whitespace
+        return _WS_RE.sub(' ', text).strip()
     
     def _extract_image(self, entry) -> Optional[str]:
         """Extract image URL from RSS entry"""
-        # Try different fields for images
-        image_fields = [
-            ('media_content', 'url'),  # Media RSS
-            ('media_thumbnail', 'url'),  # Media RSS thumbnail
-            ('enclosures', 'href'),  # Enclosures
-        ]
-        
-        for field, attr in image_fields:
-            if hasattr(entry, field):
-                media = getattr(entry, field)
-                if media:
-                    if isinstance(media, list):
-                        for item in media:
-                            if hasattr(item, attr):
-                                url = getattr(item, attr)
-                                if url and url.startswith(('http://', 'https://')):
-                                    return url
+        # Try different fields for images, in priority order
+        candidates = (
+            item.get(attr)
+            for field, attr in _IMG_FIELDS
+            if isinstance(entry.get(field), list)
+            for item in entry[field]
+        )
+        for url in candidates:
+            if url and url.startswith(('http://', 'https://')):
+                return url
         
         # Try to find image in content
-        if hasattr(entry, 'content') and entry.content:
-            for item in entry.content:
-                if hasattr(item, 'value'):
-                    # Look for img tags
-                    img_match = re.search(r'<img[^>]+src="([^"]+)"', item.value)
-                    if img_match:
-                        return img_match.group(1)
+        for item in entry.get('content') or []:
+            if 'value' in item:
+                # Look for img tags
+                img_match = _IMG_SRC_RE.search(item['value'])
+                if img_match:
+                    return img_match.group(1)
         
         return None
     
-    def fetch_multiple_feeds(self, feeds: List[Dict]) -> List[Dict]:
+    def fetch_multiple_feeds(self, feeds: List[FeedSpec]) -> List[Dict]:
         """
         Fetch multiple RSS feeds
         
         Args:
-            feeds: List of feed dictionaries with url, name, category
+            feeds: FeedSpec records (FeedSource included)
             
         Returns:
             Combined list of articles
         """
         all_articles = []
+        if not feeds:
+            return all_articles
         
-        for feed in feeds:
-            articles = self.parse_feed(
-                feed['url'],
-                feed['name'],
-                feed.get('category', 'General')
+        # map() keeps results in feed (priority) order
+        with ThreadPoolExecutor(max_workers=min(MAX_FEED_WORKERS, len(feeds))) as executor:
+            results = executor.map(
+                lambda feed: self.parse_feed(feed.url, feed.name, feed.category),
+                feeds
             )
-            all_articles.extend(articles)
+            for articles in results:
+                all_articles.extend(articles)
         
         logger.info(f"Total: Fetched {len(all_articles)} articles from {len(feeds)} feeds")
         return all_articles
\ No newline at end of file
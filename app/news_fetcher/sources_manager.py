@@ -1,18 +1,50 @@
 """
 Manage news sources - includes 50+ popular news sources
 """
-from typing import List, Dict
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
 import logging
 
+from ..core.config import FeedSpec
+
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True, frozen=True)
+class FeedSource(FeedSpec):
+    """A FeedSpec with the metadata used to prioritize it"""
+    country: str
+    reliability_score: int
+
 class NewsSourcesManager:
     """Manages news sources for the fetcher"""
     
+    # The source list is static, so it and its lookups are built once per
+    # process and shared by every instance
+    _shared: Optional[Tuple] = None
+    
     def __init__(self):
-        self.sources = self._load_sources()
+        if NewsSourcesManager._shared is None:
+            NewsSourcesManager._shared = self._build_lookups(self._load_sources())
+        (self.sources, self._by_category, self._names, self._sorted_feeds,
+         self._top_by_category) = NewsSourcesManager._shared
     
-    def _load_sources(self) -> List[Dict]:
+    @staticmethod
+    def _build_lookups(sources: List[FeedSource]) -> Tuple:
+        """Derive the category, name and priority lookups from the source list"""
+        by_category: Dict[str, Tuple[FeedSource, ...]] = {}
+        for source in sources:
+            by_category.setdefault(source.category, []).append(source)
+        by_category = {category: tuple(group) for category, group in by_category.items()}
+        names = tuple(s.name for s in sources)
+        # Prioritize high-reliability sources (stable sort keeps load order on ties)
+        sorted_feeds = tuple(sorted(sources, key=lambda x: x.reliability_score, reverse=True))
+        # Filtering the sorted list keeps that priority order within each category
+        top_by_category: Dict[str, Tuple[FeedSource, ...]] = {category: () for category in by_category}
+        for source in sorted_feeds:
+            top_by_category[source.category] += (source,)
+        return tuple(sources), by_category, names, sorted_feeds, top_by_category
+    
+    def _load_sources(self) -> List[FeedSource]:
         """Load news sources with RSS feeds"""
         sources = [
             # International News
@@ -274,24 +306,26 @@ class NewsSourcesManager:
                 })
         
         logger.info(f"Loaded {len(sources)} news sources")
-        return sources
+        return [FeedSource(**source) for source in sources]
          
-    def get_sources_by_category(self, category: str = None) -> List[Dict]:
+    def get_sources_by_category(self, category: str = None) -> List[FeedSource]:
         """Get sources, optionally filtered by category"""
         if category:
-            return [s for s in self.sources if s["category"] == category]
-        return self.sources
+            return list(self._by_category.get(category, ()))
+        return list(self.sources)
     
     def get_source_names(self) -> List[str]:
         """Get list of all source names"""
-        return [s["name"] for s in self.sources]
+        return list(self._names)
     
     def get_categories(self) -> List[str]:
         """Get unique categories"""
-        return list(set(s["category"] for s in self.sources))
+        return list(self._by_category)
     
-    def get_feeds_for_fetching(self, limit: int = 20) -> List[Dict]:
+    def get_feeds_for_fetching(self, limit: int = 20) -> List[FeedSource]:
         """Get feeds for fetching (with limit to avoid overloading)"""
-        # Prioritize high-reliability sources
-        sorted_sources = sorted(self.sources, key=lambda x: x["reliability_score"], reverse=True)
-        return sorted_sources[:limit]
\ No newline at end of file
+        return list(self._sorted_feeds[:limit])
+    
+    def get_top_feeds_by_category(self, category: str, limit: int = 5) -> List[FeedSource]:
+        """Get a category's most reliable feeds"""
+        return list(self._top_by_category.get(category, ())[:limit])
\ No newline at end of file
@@ -1,19 +1,157 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Form, Response
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import String, func, or_, select, tuple_, type_coerce, update
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload
+from cachetools import TTLCache
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+import hashlib
+import logging
 import os
+import sys
+import threading
+import time
 
-from app.database import get_db
-from app.models import Article, Category
-from app.admin_auth import verify_admin, create_session_token, get_current_admin
+from app.core.caches import invalidate_feed_cache
+from app.core.config import get_settings
+from app.database import DB_PATH, get_db
+from app.api.v1.endpoints.categories import invalidate_categories
+from app.models import Article, ArticleStatus, Category
+from app.models.minimal_models import APPROVED_ARTICLES_PAGE
+from app.admin_auth import (
+    verify_admin, create_session_token, revoke_session_token,
+    verify_admin_credentials, require_admin,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-# Setup templates
-templates = Jinja2Templates(directory="app/templates/admin")
+# Setup templates. Templates only change on deploy, so skip the per-render
+# mtime check and keep compiled bytecode across restarts.
+JINJA_CACHE_DIR = os.environ.get('JINJA_CACHE_DIR', '/tmp/jinja_cache')
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+templates = Jinja2Templates(
+    directory="app/templates/admin",
+    auto_reload=False,
+    cache_size=400,
+    # Namespaced so other apps sharing the cache directory cannot collide
+    bytecode_cache=FileSystemBytecodeCache(JINJA_CACHE_DIR, pattern='globeadmin_%s.cache'),
+)
+
+# Category rows with their article counts for the categories page. Counts may
+# trail the fetcher by up to the TTL; adding a category clears it.
+_category_rows = TTLCache(maxsize=1, ttl=60, timer=time.monotonic)
+_category_rows_lock = threading.Lock()
+
+def _load_category_rows(db: Session) -> list:
+    """Categories with an article_count, cached between page loads"""
+    with _category_rows_lock:
+        rows = _category_rows.get("rows")
+    if rows is None:
+        # One GROUP BY instead of loading every category's articles
+        rows = db.query(
+            Category.id, Category.name, Category.description, Category.created_at,
+            func.count(Article.id).label("article_count"),
+        ).outerjoin(Category.articles).group_by(Category.id).order_by(Category.id).all()
+        with _category_rows_lock:
+            _category_rows["rows"] = rows
+    return rows
+
+def _invalidate_category_rows():
+    with _category_rows_lock:
+        _category_rows.clear()
+
+def _strict_loading() -> tuple:
+    """Loader options for list queries: under DEBUG, any relationship the
+    query did not eager-load raises instead of lazily issuing a SELECT per row"""
+    return (raiseload('*'),) if get_settings().DEBUG else ()
+
+# System info for the settings page; a minute-old article count and file size is fine
+_system_info_cache = TTLCache(maxsize=1, ttl=60, timer=time.monotonic)
+_system_info_lock = threading.Lock()
+
+def _system_info(db: Session) -> dict:
+    """Python version, database size and article count, cached between page loads"""
+    with _system_info_lock:
+        info = _system_info_cache.get("info")
+    if info is None:
+        db_size = "0 MB"
+        if os.path.exists(DB_PATH):
+            db_size = f"{os.path.getsize(DB_PATH) / (1024*1024):.1f} MB"
+        info = {
+            'python_version': sys.version.split()[0],
+            'db_size': db_size,
+            'total_articles': db.query(Article).count(),
+            'last_fetch': '2024-02-18'
+        }
+        with _system_info_lock:
+            _system_info_cache["info"] = info
+    return info
+
+def _etag(*parts) -> str:
+    """Validator for a page whose content is determined by `parts`"""
+    return '"%s"' % hashlib.md5(repr(parts).encode()).hexdigest()
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    return request.headers.get("if-none-match") == etag
+
+def _revalidate_headers(etag: str) -> dict:
+    # Private pages the browser may keep but must revalidate on every load
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=_revalidate_headers(etag))
+
+def _stream_template(name: str, context: dict) -> StreamingResponse:
+    """Render a template in chunks as it is sent, for long list pages"""
+    stream = templates.get_template(name).stream(context)
+    stream.enable_buffering(10)
+    return StreamingResponse(stream, media_type="text/html")
+
+# Per-status totals for the review lists' page picker. Page 1 always recounts;
+# deeper pages reuse the total for up to a minute. Status changes clear it.
+_status_counts = TTLCache(maxsize=8, ttl=60, timer=time.monotonic)
+_status_counts_lock = threading.Lock()
+
+def _count_by_status(db: Session, status: ArticleStatus, refresh: bool = False) -> int:
+    """Number of articles with `status`, cached between page loads"""
+    with _status_counts_lock:
+        total = None if refresh else _status_counts.get(status)
+    if total is None:
+        total = db.query(Article).filter(Article.status == status).count()
+        with _status_counts_lock:
+            _status_counts[status] = total
+    return total
+
+def _page_with_total(db: Session, stmt, status: ArticleStatus, params: Optional[dict] = None,
+                     refresh: bool = False, windowed: bool = True):
+    """Run a list page query and return (articles, total with `status`).
+    
+    When the total needs recounting it is selected as COUNT(*) OVER () in the
+    same statement, which counts the full filtered set before LIMIT/OFFSET.
+    """
+    with _status_counts_lock:
+        total = None if refresh else _status_counts.get(status)
+    if total is not None or not windowed:
+        articles = db.scalars(stmt, params).all()
+        if total is None:
+            total = _count_by_status(db, status, refresh=True)
+        return articles, total
+    
+    rows = db.execute(stmt.add_columns(func.count().over()), params).all()
+    if not rows:
+        # Past the last page there is no row to carry the count
+        return [], _count_by_status(db, status, refresh=True)
+    with _status_counts_lock:
+        _status_counts[status] = rows[0][1]
+    return [row[0] for row in rows], rows[0][1]
+
+def _invalidate_status_counts():
+    with _status_counts_lock:
+        _status_counts.clear()
 
 # ==================== ADMIN LOGIN ====================
 
@@ -33,21 +171,9 @@ async def admin_login(
     password: str = Form(...)
 ):
     """Handle admin login"""
-    # Verify credentials using basic auth logic
-    from app.admin_auth import ADMIN_USERNAME, ADMIN_PASSWORD
-    import secrets
-    
-    print(f"DEBUG: Login attempt - username: {username}, password: {password}")
-    print(f"DEBUG: Expected - username: {ADMIN_USERNAME}, password: {ADMIN_PASSWORD}")
-    
-    username_match = secrets.compare_digest(username, ADMIN_USERNAME)
-    password_match = secrets.compare_digest(password, ADMIN_PASSWORD)
-    
-    print(f"DEBUG: username_match: {username_match}, password_match: {password_match}")
-    
-    if username_match and password_match:
+    if verify_admin_credentials(username, password):
         token = create_session_token(username)
-        print(f"DEBUG: Login successful, token created: {token[:10]}...")
+        logger.info("admin login ok user=%s", username)
         response = RedirectResponse(url="/admin/dashboard", status_code=303)
         response.set_cookie(
             key="admin_token",
@@ -59,7 +185,7 @@ async def admin_login(
         )
         return response
     
-    print("DEBUG: Login failed")
+    logger.warning("admin login failed user=%s", username)
     return templates.TemplateResponse(
         "login.html",
         {"request": request, "error": "Invalid credentials"},
@@ -67,8 +193,11 @@ async def admin_login(
     )
 
 @router.get("/logout")
-async def admin_logout(response: Response):
+async def admin_logout(request: Request, response: Response):
     """Logout admin"""
+    token = request.cookies.get("admin_token")
+    if token:
+        revoke_session_token(token)
     response = RedirectResponse(url="/")
     response.delete_cookie("admin_token")
     return response
@@ -76,21 +205,30 @@ async def admin_logout(response: Response):
 # ==================== ADMIN DASHBOARD ====================
 
 @router.get("/dashboard", response_class=HTMLResponse)
-async def admin_dashboard(request: Request, db: Session = Depends(get_db)):
+def admin_dashboard(request: Request, admin: str = Depends(require_admin), db: Session = Depends(get_db)):
     """Admin dashboard"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    # Get stats
-    total_articles = db.query(Article).count()
-    pending_articles = db.query(Article).filter(Article.is_approved == False).count()
-    approved_articles = db.query(Article).filter(Article.is_approved == True).count()
-    categories_count = db.query(Category).count()
+    # Get stats in one round trip, plus the newest id and edit time, which
+    # together with the counts change whenever the page would
+    stats = db.query(
+        func.count(),
+        func.count().filter(Article.status == ArticleStatus.PENDING),
+        func.count().filter(Article.status == ArticleStatus.APPROVED),
+        select(func.count()).select_from(Category).scalar_subquery(),
+        func.max(Article.id),
+        func.max(Article.edited_at),
+    ).select_from(Article).one()
+    etag = _etag(admin, *stats)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    total_articles, pending_articles, approved_articles, categories_count = stats[:4]
     
     # Get recent pending articles
-    recent_pending = db.query(Article).filter(
-        Article.is_approved == False
+    recent_pending = db.query(Article).options(
+        selectinload(Article.category),
+        load_only(Article.title, Article.source, Article.category_id, Article.published_at),
+        *_strict_loading(),
+    ).filter(
+        Article.status == ArticleStatus.PENDING
     ).order_by(
         Article.published_at.desc()
     ).limit(10).all()
@@ -105,56 +243,104 @@ async def admin_dashboard(request: Request, db: Session = Depends(get_db)):
             "approved_articles": approved_articles,
             "categories_count": categories_count,
             "recent_pending": recent_pending
-        }
+        },
+        headers=_revalidate_headers(etag)
     )
 
 # ==================== ARTICLE REVIEW ====================
 
+# published_at as the text SQLite stored. Fetched rows use an ISO "T" separator
+# and ORM rows a space, so cursors are compared as stored, never re-rendered.
+_PUBLISHED_TEXT = type_coerce(Article.published_at, String)
+
+def _pending_page_stmt(page: int, limit: int, before_published_at: Optional[str] = None,
+                       before_id: Optional[int] = None):
+    """Select one page of pending articles, newest first.
+    
+    With a (before_published_at, before_id) cursor the page seeks past that
+    row; otherwise it uses OFFSET. An empty before_published_at means the
+    cursor row had no published_at (NULLs sort last).
+    """
+    # Only what the list renders; full_content is only checked for presence
+    # but still has to be loaded to avoid a lazy load per row
+    stmt = select(Article).options(
+        selectinload(Article.category),
+        load_only(
+            Article.title, Article.source, Article.category_id, Article.published_at,
+            Article.is_breaking, Article.human_summary, Article.preview_content,
+            Article.full_content,
+        ),
+        *_strict_loading(),
+    ).where(
+        Article.status == ArticleStatus.PENDING
+    )
+    if before_published_at is not None and before_id is not None:
+        if before_published_at:
+            stmt = stmt.where(or_(
+                tuple_(_PUBLISHED_TEXT, Article.id) < (before_published_at, before_id),
+                Article.published_at.is_(None),
+            ))
+        else:
+            stmt = stmt.where(Article.published_at.is_(None), Article.id < before_id)
+    else:
+        stmt = stmt.offset((page - 1) * limit)
+    return stmt.order_by(
+        Article.published_at.desc(), Article.id.desc()
+    ).limit(limit)
+
+def _seek_cursor(db: Session, article: Article) -> tuple:
+    """(published_at as stored or '', id) of the last row on a page"""
+    published = db.scalar(select(_PUBLISHED_TEXT).where(Article.id == article.id))
+    return published or '', article.id
+
 @router.get("/articles/pending", response_class=HTMLResponse)
-async def pending_articles(
+def pending_articles(
     request: Request,
     page: int = 1,
     limit: int = 20,
+    before_published_at: Optional[str] = None,
+    before_id: Optional[int] = None,
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
-    """List pending articles for review"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
+    """List pending articles for review
     
-    skip = (page - 1) * limit
-    articles = db.query(Article).filter(
-        Article.is_approved == False
-    ).order_by(
-        Article.published_at.desc()
-    ).offset(skip).limit(limit).all()
+    The Next link passes the last row as a (before_published_at, before_id)
+    cursor so paging forward seeks in the index; numbered links use OFFSET.
+    """
+    stmt = _pending_page_stmt(page, limit, before_published_at, before_id)
+    seek = before_published_at is not None and before_id is not None
     
-    total = db.query(Article).filter(Article.is_approved == False).count()
+    # A seek page only sees rows past the cursor, so it cannot count them all
+    articles, total = _page_with_total(
+        db, stmt, ArticleStatus.PENDING, refresh=page == 1, windowed=not seek
+    )
     total_pages = (total + limit - 1) // limit
     
-    return templates.TemplateResponse(
+    return _stream_template(
         "pending_articles.html",
         {
             "request": request,
             "articles": articles,
             "page": page,
             "total_pages": total_pages,
-            "total": total
+            "total": total,
+            "next_cursor": _seek_cursor(db, articles[-1]) if articles and page < total_pages else None,
         }
     )
 
 @router.get("/articles/{article_id}/review", response_class=HTMLResponse)
-async def review_article(
+def review_article(
     request: Request,
     article_id: int,
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Review single article"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    article = db.query(Article).filter(Article.id == article_id).first()
+    # One row, so join the category in rather than issuing a second SELECT
+    article = db.query(Article).options(joinedload(Article.category)).filter(
+        Article.id == article_id
+    ).first()
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
@@ -166,54 +352,58 @@ async def review_article(
         }
     )
 
+def _update_article(db: Session, article_id: int, values: dict):
+    """Apply `values` to one article in a single UPDATE ... RETURNING and commit"""
+    updated = db.execute(
+        update(Article)
+        .where(Article.id == article_id)
+        .values(values)
+        .returning(Article.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if not updated:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Article not found")
+    db.commit()
+    # Statement-level updates skip the ORM hooks that main.py listens on
+    invalidate_feed_cache()
+
 @router.post("/articles/{article_id}/approve")
-async def approve_article(
+def approve_article(
     request: Request,
     article_id: int,
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Approve article"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    article = db.query(Article).filter(Article.id == article_id).first()
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    
-    article.is_approved = True
-    article.approved_at = datetime.utcnow()
-    article.approved_by = admin
-    article.edited_at = datetime.utcnow()
-    db.commit()
+    _update_article(db, article_id, {
+        'status': ArticleStatus.APPROVED,
+        'approved_at': datetime.utcnow(),
+        'approved_by': admin
+    })
+    _invalidate_status_counts()
     
     return RedirectResponse(url="/admin/articles/pending", status_code=303)
 
 @router.post("/articles/{article_id}/reject")
-async def reject_article(
+def reject_article(
     request: Request,
     article_id: int,
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Reject article (will be hidden)"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    article = db.query(Article).filter(Article.id == article_id).first()
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    
-    article.is_approved = False
-    article.is_rejected = True
-    article.rejected_at = datetime.utcnow()
-    article.rejected_by = admin
-    db.commit()
+    _update_article(db, article_id, {
+        'status': ArticleStatus.REJECTED,
+        'rejected_at': datetime.utcnow(),
+        'rejected_by': admin
+    })
+    _invalidate_status_counts()
     
     return RedirectResponse(url="/admin/articles/pending", status_code=303)
 
 @router.post("/articles/{article_id}/edit")
-async def edit_article(
+def edit_article(
     request: Request,
     article_id: int,
     title: str = Form(...),
@@ -222,57 +412,44 @@ async def edit_article(
     full_content: str = Form(None),
     category_id: int = Form(...),
     is_breaking: bool = Form(False),
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Edit and save article"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    article = db.query(Article).filter(Article.id == article_id).first()
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    
-    article.title = title
-    article.description = description
-    article.content = content
+    values = {
+        'title': title,
+        'description': description,
+        'content': content,
+        'category_id': category_id,
+        'is_breaking': is_breaking,
+        'edited_at': datetime.utcnow(),
+        'edited_by': admin
+    }
     if full_content:
-        article.full_content = full_content
-    article.category_id = category_id
-    article.is_breaking = is_breaking
-    article.is_edited = True
-    article.edited_at = datetime.utcnow()
-    article.edited_by = admin
-    
-    db.commit()
+        values['full_content'] = full_content
+    _update_article(db, article_id, values)
     
     return RedirectResponse(url=f"/admin/articles/{article_id}/review", status_code=303)
 
 # ==================== APPROVED ARTICLES MANAGEMENT ====================
 
 @router.get("/articles/approved", response_class=HTMLResponse)
-async def approved_articles(
+def approved_articles(
     request: Request,
     page: int = 1,
     limit: int = 20,
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """List approved articles"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
     skip = (page - 1) * limit
-    articles = db.query(Article).filter(
-        Article.is_approved == True
-    ).order_by(
-        Article.approved_at.desc()
-    ).offset(skip).limit(limit).all()
-    
-    total = db.query(Article).filter(Article.is_approved == True).count()
+    articles, total = _page_with_total(
+        db, APPROVED_ARTICLES_PAGE.options(*_strict_loading()), ArticleStatus.APPROVED,
+        {"skip": skip, "n": limit}, refresh=page == 1
+    )
     total_pages = (total + limit - 1) // limit
     
-    return templates.TemplateResponse(
+    return _stream_template(
         "approved_articles.html",
         {
             "request": request,
@@ -286,154 +463,115 @@ async def approved_articles(
 # ==================== CATEGORY MANAGEMENT ====================
 
 @router.get("/categories", response_class=HTMLResponse)
-async def manage_categories(
+def manage_categories(
     request: Request,
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Manage categories"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
+    categories = _load_category_rows(db)
+    
+    etag = _etag(admin, *map(tuple, categories))
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
     
-    categories = db.query(Category).all()
     return templates.TemplateResponse(
         "categories.html",
         {
             "request": request,
             "categories": categories
-        }
+        },
+        headers=_revalidate_headers(etag)
     )
 
 @router.post("/categories/add")
-async def add_category(
+def add_category(
     request: Request,
     name: str = Form(...),
     description: str = Form(""),
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Add new category"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
     category = Category(name=name, description=description)
     db.add(category)
     db.commit()
+    invalidate_categories()
+    _invalidate_category_rows()
     
     return RedirectResponse(url="/admin/categories", status_code=303)
 
-# ==================== SETTINGS ====================
+# ==================== BULK REVIEW ====================
 
-@router.get("/settings", response_class=HTMLResponse)
-async def admin_settings(request: Request):
-    """Admin settings"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    return templates.TemplateResponse(
-        "settings.html",
-        {
-            "request": request,
-            "admin": admin
-        }
-    )
+def _review_pending(db: Session, status: ArticleStatus, admin: str,
+                    ids: Optional[List[int]] = None) -> int:
+    """Approve or reject pending articles (all of them, or just `ids`) in one UPDATE.
+    
+    Returns how many were changed, from the statement's rowcount.
+    """
+    stamp = 'approved' if status == ArticleStatus.APPROVED else 'rejected'
+    stmt = update(Article).where(Article.status == ArticleStatus.PENDING)
+    if ids is not None:
+        stmt = stmt.where(Article.id.in_(ids))
+    count = db.execute(
+        stmt.values({
+            'status': status,
+            f'{stamp}_at': datetime.utcnow(),
+            f'{stamp}_by': admin
+        }).execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    invalidate_feed_cache()
+    _invalidate_status_counts()
+    return count
 
 @router.post("/articles/bulk-approve")
-async def bulk_approve_articles(
+def bulk_approve_articles(
     request: Request,
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Approve all pending articles"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    count = db.query(Article).filter(Article.is_approved == False).update(
-        {
-            'is_approved': True,
-            'approved_at': datetime.utcnow(),
-            'approved_by': admin,
-            'edited_at': datetime.utcnow()
-        },
-        synchronize_session=False
-    )
-    db.commit()
-    
-    return RedirectResponse(url="/admin/articles/approved", status_code=303)
+    count = _review_pending(db, ArticleStatus.APPROVED, admin)
+    return RedirectResponse(url=f"/admin/articles/approved?approved={count}", status_code=303)
 
 @router.post("/articles/bulk-reject")
-async def bulk_reject_articles(
+def bulk_reject_articles(
     request: Request,
+    admin: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Reject all pending articles"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    count = db.query(Article).filter(Article.is_approved == False).update(
-        {
-            'is_rejected': True,
-            'rejected_at': datetime.utcnow(),
-            'rejected_by': admin,
-            'edited_at': datetime.utcnow()
-        },
-        synchronize_session=False
-    )
-    db.commit()
-    
-    return RedirectResponse(url="/admin/articles/pending", status_code=303)
+    count = _review_pending(db, ArticleStatus.REJECTED, admin)
+    return RedirectResponse(url=f"/admin/articles/pending?rejected={count}", status_code=303)
 
-# ==================== SETTINGS MANAGEMENT ====================
+@router.post("/articles/approve-selected")
+def approve_selected_articles(
+    request: Request,
+    ids: List[int] = Form([]),
+    admin: str = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Approve the pending articles ticked on the review list"""
+    count = _review_pending(db, ArticleStatus.APPROVED, admin, ids) if ids else 0
+    return RedirectResponse(url=f"/admin/articles/pending?approved={count}", status_code=303)
 
-@router.get("/settings", response_class=HTMLResponse)
-async def admin_settings(request: Request, db: Session = Depends(get_db)):
-    """Admin settings page"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    print(f"DEBUG: admin_settings called by {admin}")
-    
-    # Simple settings dict for testing
-    settings = {
-        'site_name': 'Globe News',
-        'site_url': 'https://globe-news-jade.vercel.app',
-    }
-    
-    print(f"DEBUG: settings dict: {settings}")
-    print(f"DEBUG: settings.site_name: {settings.get('site_name')}")
-    
-    # Simple system info
-    system_info = {
-        'python_version': '3.11',
-        'db_size': '10 MB',
-        'total_articles': 2480,
-        'last_fetch': '2024-02-18'
-    }
-    
-    template_data = {
-        "request": request,
-        "admin": admin,
-        "settings": settings,
-        "system_info": system_info
-    }
-    print(f"DEBUG: template_data keys: {template_data.keys()}")
-    
-    return templates.TemplateResponse("settings.html", template_data)
+@router.post("/articles/reject-selected")
+def reject_selected_articles(
+    request: Request,
+    ids: List[int] = Form([]),
+    admin: str = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Reject the pending articles ticked on the review list"""
+    count = _review_pending(db, ArticleStatus.REJECTED, admin, ids) if ids else 0
+    return RedirectResponse(url=f"/admin/articles/pending?rejected={count}", status_code=303)
+
+# ==================== SETTINGS MANAGEMENT ====================
 
 @router.get("/settings", response_class=HTMLResponse)
-async def admin_settings(request: Request, db: Session = Depends(get_db)):
+def admin_settings(request: Request, admin: str = Depends(require_admin), db: Session = Depends(get_db)):
     """Admin settings page"""
-    admin = get_current_admin(request)
-    if not admin:
-        return RedirectResponse(url="/admin/login")
-    
-    print("="*50)
-    print("ADMIN SETTINGS DEBUG")
-    print(f"Admin user: {admin}")
-    
     # Settings dict
     settings = {
         'site_name': 'Globe News',
@@ -446,21 +584,7 @@ async def admin_settings(request: Request, db: Session = Depends(get_db)):
         'enable_preview_generation': True
     }
     
-    # System info
-    import sys
-    import os
-    db_path = '/app/data/globe_news.db'
-    db_size = "0 MB"
-    if os.path.exists(db_path):
-        size_bytes = os.path.getsize(db_path)
-        db_size = f"{size_bytes / (1024*1024):.1f} MB"
-    
-    system_info = {
-        'python_version': sys.version.split()[0],
-        'db_size': db_size,
-        'total_articles': db.query(Article).count(),
-        'last_fetch': '2024-02-18'
-    }
+    system_info = _system_info(db)
     
     # Create template context
     context = {
@@ -470,16 +594,10 @@ async def admin_settings(request: Request, db: Session = Depends(get_db)):
         "system_info": system_info
     }
     
-    # Print debug info
-    print(f"Context keys: {list(context.keys())}")
-    print(f"Settings keys: {list(settings.keys())}")
-    print(f"System info keys: {list(system_info.keys())}")
-    print("="*50)
-    
     return templates.TemplateResponse("settings.html", context)
 
 @router.post("/settings/update")
-async def update_settings(
+def update_settings(
     request: Request,
     response: Response,
     site_name: str = Form(...),
@@ -493,17 +611,12 @@ async def update_settings(
     current_password: str = Form(""),
     new_password: str = Form(""),
     confirm_password: str = Form(""),
+    admin_user: str = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Update settings"""
-    admin_user = get_current_admin(request)
-    if not admin_user:
-        return RedirectResponse(url="/admin/login")
-    
     # Handle password change if requested
     if current_password and new_password and confirm_password:
-        from app.admin_auth import ADMIN_PASSWORD, verify_admin_credentials
-        
         # Verify current password
         if not verify_admin_credentials(admin_user, current_password):
             return templates.TemplateResponse(
@@ -568,20 +681,18 @@ async def update_settings(
         # Update password (you'll need to implement this in admin_auth.py)
         # update_admin_password(admin_user, new_password)
         
-        print(f"Password change requested for {admin_user}")
+        logger.info("admin password change requested user=%s", admin_user)
     
     # Here you would save settings to database or file
-    print(f"Settings updated by {admin_user}:")
-    print(f"  Site Name: {site_name}")
-    print(f"  Site URL: {site_url}")
-    print(f"  Articles per page: {articles_per_page}")
+    logger.debug("settings updated user=%s site_name=%s site_url=%s articles_per_page=%s",
+                 admin_user, site_name, site_url, articles_per_page)
     
     # Redirect back to settings with success message
     response = RedirectResponse(url="/admin/settings?success=true", status_code=303)
     return response
 
 @router.post("/admin/articles/{article_id}/save-summary")
-async def admin_save_human_summary(
+def admin_save_human_summary(
     request: Request,
     article_id: int,
     human_summary: str = Form(None),
@@ -602,16 +713,14 @@ async def admin_save_human_summary(
     
     # If action is save_and_approve, also approve the article
     if action == "save_and_approve":
-        article.is_approved = True
-        article.is_rejected = False
+        article.status = ArticleStatus.APPROVED
         article.approved_at = datetime.utcnow()
         article.approved_by = request.session.get("admin_username", "admin")
     
-    # Commit changes
+    # Commit changes; the Article update listeners clear the public feed cache
     db.commit()
-    
-    # Clear cache for this article
-    await clear_article_cache(article_id)
+    if action == "save_and_approve":
+        _invalidate_status_counts()
     
     # Redirect based on action
     if action == "save_and_approve":
@@ -0,0 +1,15 @@
+"""
+Pydantic schemas for categories.
+"""
+from typing import Optional
+from pydantic import BaseModel
+
+
+class CategoryOut(BaseModel):
+    """Schema for category responses."""
+    id: int
+    name: str
+    description: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
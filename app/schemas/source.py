@@ -0,0 +1,10 @@
+"""
+Pydantic schemas for news sources.
+"""
+from typing import List
+from pydantic import BaseModel
+
+
+class SourceListResponse(BaseModel):
+    """Schema for the list of source names."""
+    sources: List[str]
@@ -7,6 +7,8 @@ from ..models.minimal_models import Article
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_PARAGRAPHS = 6
+
 class SummarizerService:
     """Service layer for AI summarization operations"""
     
@@ -50,12 +52,9 @@ class SummarizerService:
             )
             
             # Update article with generated summaries
-            article.ai_summary_1 = summaries.get("ai_summary_1")
-            article.ai_summary_2 = summaries.get("ai_summary_2")
-            article.ai_summary_3 = summaries.get("ai_summary_3")
-            article.ai_summary_4 = summaries.get("ai_summary_4")
-            article.ai_summary_5 = summaries.get("ai_summary_5")
-            article.ai_summary_6 = summaries.get("ai_summary_6")
+            article.ai_summaries = [
+                summaries.get(f"ai_summary_{i}") for i in range(1, SUMMARY_PARAGRAPHS + 1)
+            ]
             article.ai_summary_generated = True
             article.ai_summary_generated_at = datetime.utcnow()
             
@@ -117,13 +116,13 @@ class SummarizerService:
     
     def _format_existing_summary(self, article: Article) -> Dict:
         """Format existing summary from article object"""
+        paragraphs = article.summary_paragraphs
+        summary = {
+            f"ai_summary_{i}": paragraphs[i - 1] if i <= len(paragraphs) else None
+            for i in range(1, SUMMARY_PARAGRAPHS + 1)
+        }
         return {
-            "ai_summary_1": article.ai_summary_1,
-            "ai_summary_2": article.ai_summary_2,
-            "ai_summary_3": article.ai_summary_3,
-            "ai_summary_4": article.ai_summary_4,
-            "ai_summary_5": article.ai_summary_5,
-            "ai_summary_6": article.ai_summary_6,
+            **summary,
             "ai_summary_generated": article.ai_summary_generated,
             "ai_summary_generated_at": article.ai_summary_generated_at.isoformat() if article.ai_summary_generated_at else None
         }
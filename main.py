@@ -9,7 +9,7 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -21,14 +21,23 @@ import feedparser
 import asyncio
 import sqlite3
 import logging
+import threading
 from contextlib import asynccontextmanager
+from collections import Counter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+import orjson
 import re
 import random
 import html
 import ssl
-from app.database import init_db
+from app.core.caches import feed_cache, feed_cache_lock, invalidate_feed_cache, invalidate_sources_cache
+from app.database import backfill_article_source_ids, init_db
+from app.models import Article
 
 DB_PATH = os.environ.get('DB_PATH', '/app/data/globe_news.db')
+# Opt-in: rejected articles older than this many days are pruned; 0 disables pruning
+ARTICLE_RETENTION_DAYS = int(os.environ.get('ARTICLE_RETENTION_DAYS', '0'))
 
 # ✅ NEW: Import for content extraction (install with: pip install readability-lxml)
 try:
@@ -78,9 +87,7 @@ def init_database():
             author TEXT,
             language TEXT DEFAULT 'en',
             is_breaking BOOLEAN DEFAULT 0,
-            is_approved BOOLEAN DEFAULT 0,
-            is_rejected BOOLEAN DEFAULT 0,
-            is_edited BOOLEAN DEFAULT 0,
+            status SMALLINT DEFAULT 0,  -- 0=pending, 1=approved, 2=rejected
             approved_at DATETIME,
             approved_by TEXT,
             rejected_at DATETIME,
@@ -89,13 +96,20 @@ def init_database():
             edited_by TEXT,
             editor_notes TEXT,
             human_summary TEXT,  -- ADDED: Human-written summary field
+            ai_summaries TEXT,  -- JSON list of AI summary paragraphs
+            ai_summary_generated BOOLEAN DEFAULT 0,
+            ai_summary_generated_at DATETIME,
+            content_length INTEGER GENERATED ALWAYS AS (length(COALESCE(NULLIF(full_content, ''), content, ''))) VIRTUAL,
+            view_count INTEGER DEFAULT 0,
+            display_summary TEXT GENERATED ALWAYS AS (COALESCE(NULLIF(human_summary, ''), NULLIF(preview_content, ''), description)) VIRTUAL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (category_id) REFERENCES categories (id)
         )
         ''')
         
         # Check and add missing columns
-        cursor.execute("PRAGMA table_info(articles)")
+        # table_xinfo also lists generated columns
+        cursor.execute("PRAGMA table_xinfo(articles)")
         existing_columns = [column[1] for column in cursor.fetchall()]
         
         # List of expected columns
@@ -103,9 +117,7 @@ def init_database():
             ('preview_content', 'TEXT'),
             ('full_content', 'TEXT'),
             ('is_breaking', 'BOOLEAN DEFAULT 0'),
-            ('is_approved', 'BOOLEAN DEFAULT 0'),
-            ('is_rejected', 'BOOLEAN DEFAULT 0'),
-            ('is_edited', 'BOOLEAN DEFAULT 0'),
+            ('status', 'SMALLINT DEFAULT 0'),
             ('approved_at', 'DATETIME'),
             ('approved_by', 'TEXT'),
             ('rejected_at', 'DATETIME'),
@@ -113,7 +125,14 @@ def init_database():
             ('edited_at', 'DATETIME'),
             ('edited_by', 'TEXT'),
             ('editor_notes', 'TEXT'),
-            ('human_summary', 'TEXT')  # ADDED: Human summary column
+            ('human_summary', 'TEXT'),  # ADDED: Human summary column
+            ('ai_summaries', 'TEXT'),  # JSON list of AI summary paragraphs
+            ('ai_summary_generated', 'BOOLEAN DEFAULT 0'),
+            ('ai_summary_generated_at', 'DATETIME'),
+            ('source_id', 'INTEGER'),  # news_sources.id, backfilled by app.database
+            ('view_count', 'INTEGER DEFAULT 0'),
+            ('content_length', "INTEGER GENERATED ALWAYS AS (length(COALESCE(NULLIF(full_content, ''), content, ''))) VIRTUAL"),
+            ('display_summary', "TEXT GENERATED ALWAYS AS (COALESCE(NULLIF(human_summary, ''), NULLIF(preview_content, ''), description)) VIRTUAL")
         ]
         
         for column_name, column_type in expected_columns:
@@ -124,11 +143,81 @@ def init_database():
                 except Exception as e:
                     logger.warning(f"Could not add column {column_name}: {e}")
         
+        # Fold the old is_approved/is_rejected flags into the status column
+        if 'status' not in existing_columns and {'is_approved', 'is_rejected'} <= set(existing_columns):
+            logger.info("Migrating approval flags to status column")
+            cursor.execute('''
+                UPDATE articles SET status = CASE
+                    WHEN is_rejected = 1 THEN 2
+                    WHEN is_approved = 1 THEN 1
+                    ELSE 0
+                END
+            ''')
+        
+        # status and edited_at replace the old boolean flags. Approvals used to
+        # stamp edited_at too, so is_edited decides which stamps are real edits.
+        if 'is_edited' in existing_columns:
+            cursor.execute('''
+                UPDATE articles SET edited_at = CASE
+                    WHEN is_edited = 1 THEN COALESCE(edited_at, approved_at, created_at)
+                    ELSE NULL
+                END
+            ''')
+        cursor.execute('DROP INDEX IF EXISTS idx_articles_approved')
+        for legacy in ('is_approved', 'is_rejected', 'is_edited'):
+            if legacy in existing_columns:
+                try:
+                    cursor.execute(f'ALTER TABLE articles DROP COLUMN {legacy}')
+                except Exception as e:
+                    logger.warning(f"Could not drop column {legacy}: {e}")
+        
+        # Fold the old ai_summary_1..6 columns into the ai_summaries JSON list
+        legacy_summaries = [f'ai_summary_{i}' for i in range(1, 7) if f'ai_summary_{i}' in existing_columns]
+        if legacy_summaries:
+            logger.info("Migrating ai_summary_N columns to ai_summaries")
+            cursor.execute(f'''
+                UPDATE articles SET ai_summaries = (
+                    SELECT json_group_array(value)
+                    FROM json_each(json_array({', '.join(legacy_summaries)}))
+                    WHERE value IS NOT NULL
+                )
+                WHERE ai_summaries IS NULL
+                  AND ({' OR '.join(f'{c} IS NOT NULL' for c in legacy_summaries)})
+            ''')
+            for column_name in legacy_summaries:
+                try:
+                    cursor.execute(f'ALTER TABLE articles DROP COLUMN {column_name}')
+                except Exception as e:
+                    logger.warning(f"Could not drop column {column_name}: {e}")
+        
+        # Old databases carry summary/thumbnail_url copies of description/url_to_image
+        for legacy, canonical in (('summary', 'description'), ('thumbnail_url', 'url_to_image')):
+            if legacy in existing_columns:
+                logger.info(f"Folding {legacy} into {canonical}")
+                cursor.execute(f'''
+                    UPDATE articles SET {canonical} = {legacy}
+                    WHERE ({canonical} IS NULL OR {canonical} = '') AND {legacy} IS NOT NULL
+                ''')
+                try:
+                    cursor.execute(f'ALTER TABLE articles DROP COLUMN {legacy}')
+                except Exception as e:
+                    logger.warning(f"Could not drop column {legacy}: {e}")
+        
         # Create indexes
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_language ON articles(language)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_approved ON articles(is_approved)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status, published_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_status_approved ON articles(status, approved_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_feed ON articles(status, language, published_at)')
+        # (category_id, published_at) replaces the single-column category index
+        cursor.execute('DROP INDEX IF EXISTS idx_articles_category')
+        # Indexes no query uses: a full boolean index, and duplicates of the
+        # rowid primary keys left by older SQLAlchemy create_all runs
+        for index_name in ('idx_articles_content_fetched', 'ix_articles_id', 'ix_categories_id',
+                           'ix_news_sources_id', 'ix_news_sources_is_active'):
+            cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_cat_pub ON articles(category_id, published_at)')
         
         # Insert default categories
         default_categories = [
@@ -159,10 +248,92 @@ def init_database():
 
 def get_db_connection():
     """Get database connection."""
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
     conn.row_factory = sqlite3.Row
     return conn
 
+def prune_stale_articles(days: int = ARTICLE_RETENTION_DAYS) -> int:
+    """Delete rejected articles published more than `days` ago.
+    
+    Disabled when `days` is 0 (the default). Pending articles are never
+    deleted, so the moderation queue is left alone, and approved ones are
+    kept. Returns the number of rows deleted.
+    """
+    if days <= 0:
+        return 0
+    cutoff = datetime.now() - timedelta(days=days)
+    conn = get_db_connection()
+    try:
+        # status = 2 AND published_at < ? is a range scan on idx_articles_status
+        cursor = conn.execute(
+            'DELETE FROM articles WHERE status = 2 AND published_at < ?',
+            (cutoff.isoformat(),)
+        )
+        conn.commit()
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+def resolve_category_ids(cursor, names) -> Dict[str, int]:
+    """Map category names to ids with one IN query, creating any that are missing."""
+    names = set(names)
+    if not names:
+        return {}
+    placeholders = ','.join('?' * len(names))
+    query = f'SELECT name, id FROM categories WHERE name IN ({placeholders})'
+    cursor.execute(query, tuple(names))
+    category_ids = {name: category_id for name, category_id in cursor.fetchall()}
+    
+    missing = names - category_ids.keys()
+    if missing:
+        cursor.executemany(
+            'INSERT OR IGNORE INTO categories (name, description) VALUES (?, ?)',
+            [(name, f'{name} news') for name in missing]
+        )
+        cursor.execute(query, tuple(names))
+        category_ids = {name: category_id for name, category_id in cursor.fetchall()}
+    return category_ids
+
+# ORM flushes and legacy Query.update()/delete() clear the feed cache here.
+# 2.0-style session.execute(update(...)) fires neither hook, so the admin
+# routes call invalidate_feed_cache() themselves after committing.
+for _event_name in ('after_insert', 'after_update', 'after_delete'):
+    event.listen(Article, _event_name, invalidate_feed_cache)
+event.listen(Session, 'after_bulk_update', invalidate_feed_cache)
+event.listen(Session, 'after_bulk_delete', invalidate_feed_cache)
+
+# Article views are counted in memory and written in one batch by view_flusher()
+_pending_views: Counter = Counter()
+_views_lock = threading.Lock()  # sync endpoints record views from the threadpool
+
+def record_article_view(article_id: int):
+    """Count a view without touching the database."""
+    with _views_lock:
+        _pending_views[article_id] += 1
+
+def flush_article_views() -> int:
+    """Write buffered view counts in a single transaction. Returns rows updated."""
+    global _pending_views
+    with _views_lock:
+        if not _pending_views:
+            return 0
+        pending, _pending_views = _pending_views, Counter()
+    conn = get_db_connection()
+    try:
+        conn.executemany(
+            'UPDATE articles SET view_count = COALESCE(view_count, 0) + ? WHERE id = ?',
+            [(count, article_id) for article_id, count in pending.items()]
+        )
+        conn.commit()
+        return len(pending)
+    except Exception:
+        # Put the counts back so the next flush retries them
+        with _views_lock:
+            _pending_views.update(pending)
+        raise
+    finally:
+        conn.close()
+
 # ==================== UPDATED RSS FEEDS CONFIGURATION ====================
 
 RSS_FEEDS = [
@@ -435,6 +606,7 @@ FALLBACK_ARTICLES = [
 class NewsFetcher:
     def __init__(self):
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        self.category_ids: Dict[str, int] = {}
         self.timeout = aiohttp.ClientTimeout(total=45)
         self.headers = {
             'User-Agent': self.user_agent,
@@ -451,6 +623,16 @@ class NewsFetcher:
         
         total_fetched = 0
         
+        # Resolve every feed's category up front instead of once per entry
+        conn = get_db_connection()
+        try:
+            self.category_ids = resolve_category_ids(
+                conn.cursor(), (feed.get('category', 'General') for feed in RSS_FEEDS)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        
         # Fetch feeds one by one (simpler, more reliable)
         for feed in RSS_FEEDS:
             try:
@@ -640,18 +822,10 @@ class NewsFetcher:
         
         # Get or create category
         category_name = feed.get('category', 'General')
-        cursor.execute('SELECT id, name FROM categories WHERE name = ?', (category_name,))
-        category = cursor.fetchone()
-        
-        if not category:
-            cursor.execute(
-                'INSERT INTO categories (name, description) VALUES (?, ?)',
-                (category_name, f'{category_name} news')
-            )
-            category_id = cursor.lastrowid
-        else:
-            category_id = category[0]
-            category_name = category[1]
+        category_id = self.category_ids.get(category_name)
+        if category_id is None:
+            category_id = resolve_category_ids(cursor, [category_name])[category_name]
+            self.category_ids[category_name] = category_id
         
         # Get author
         author = entry.get('author', '')
@@ -663,7 +837,7 @@ class NewsFetcher:
             INSERT INTO articles (
                 title, description, url, url_to_image, published_at,
                 content, full_content, category_id, source, author, language,
-                is_approved
+                status
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (
             title,
@@ -677,7 +851,7 @@ class NewsFetcher:
             feed['name'],
             author[:200],
             feed['language'],
-            0  # is_approved = False by default
+            0  # status = pending by default
         ))
         
         article_id = cursor.lastrowid
@@ -791,6 +965,8 @@ class NewsFetcher:
             }
         ]
         
+        category_ids = resolve_category_ids(cursor, (a['category'] for a in fallback_articles))
+        
         for article_data in fallback_articles:
             try:
                 # Check if already exists (by URL)
@@ -798,26 +974,14 @@ class NewsFetcher:
                 if cursor.fetchone():
                     continue
                 
-                # Get or create category
-                category_name = article_data['category']
-                cursor.execute('SELECT id FROM categories WHERE name = ?', (category_name,))
-                category = cursor.fetchone()
-                
-                if not category:
-                    cursor.execute(
-                        'INSERT INTO categories (name, description) VALUES (?, ?)',
-                        (category_name, f'{category_name} news')
-                    )
-                    category_id = cursor.lastrowid
-                else:
-                    category_id = category[0]
+                category_id = category_ids[article_data['category']]
                 
                 # Save article
                 cursor.execute('''
                     INSERT INTO articles (
                         title, description, url, url_to_image, published_at,
                         content, full_content, category_id, source, author, language,
-                        is_approved
+                        status
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
                     article_data['title'],
@@ -831,7 +995,7 @@ class NewsFetcher:
                     article_data['source'],
                     article_data['author'],
                     article_data['language'],
-                    0  # is_approved = False by default
+                    0  # status = pending by default
                 ))
                 
                 saved_count += 1
@@ -1365,15 +1529,32 @@ async def background_fetcher():
             
             if count > 0:
                 logger.info(f"Background fetch: Saved {count} new articles")
+                # Register the new articles' sources so /sources lists them
+                if backfill_article_source_ids():
+                    invalidate_sources_cache()
             else:
                 logger.info("No new articles fetched in this cycle")
             
+            if ARTICLE_RETENTION_DAYS > 0:
+                pruned = prune_stale_articles()
+                if pruned:
+                    logger.info(f"Pruned {pruned} stale rejected articles")
+            
             await asyncio.sleep(3600)
             
         except Exception as e:
             logger.error(f"Error in background fetcher: {e}")
             await asyncio.sleep(600)
 
+async def view_flusher(interval: int = 30):
+    """Periodically persist buffered article view counts."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            flush_article_views()
+        except Exception as e:
+            logger.error(f"Error flushing view counts: {e}")
+
 # ==================== FASTAPI APP ====================
 
 @asynccontextmanager
@@ -1384,6 +1565,9 @@ async def lifespan(app: FastAPI):
     
     try:
         init_database()
+        # ORM-only tables (news_sources, ...) and the source_id backfill,
+        # which need the articles table created above
+        init_db()
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
     
@@ -1407,12 +1591,18 @@ async def lifespan(app: FastAPI):
     
     # Start background tasks
     task = asyncio.create_task(background_fetcher())
+    views_task = asyncio.create_task(view_flusher())
     
     yield
     
     # Shutdown
     logger.info("Shutting down Globe News API...")
     task.cancel()
+    views_task.cancel()
+    try:
+        flush_article_views()
+    except Exception as e:
+        logger.error(f"Error flushing view counts: {e}")
 
 # Create FastAPI app
 app = FastAPI(
@@ -1450,7 +1640,7 @@ app.include_router(admin.router)
 # ==================== API ENDPOINTS ====================
 
 @app.get("/")
-async def root():
+def root():
     """Root endpoint with system info."""
     try:
         conn = get_db_connection()
@@ -1530,7 +1720,7 @@ async def health_status():
     }
 
 @app.get("/api/v1/articles")
-async def get_articles(
+def get_articles(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     category: str = Query(None),
@@ -1538,6 +1728,14 @@ async def get_articles(
     search: str = Query(None)
 ):
     """Get articles with filtering."""
+    # Searches are too varied to be worth caching
+    cache_key = None if search else (skip, limit, category, language)
+    if cache_key is not None:
+        with feed_cache_lock:
+            cached = feed_cache.get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+    
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
@@ -1547,7 +1745,7 @@ async def get_articles(
             SELECT a.*, c.name as category_name 
             FROM articles a 
             LEFT JOIN categories c ON a.category_id = c.id 
-            WHERE a.is_approved = 1
+            WHERE a.status = 1
         '''
         params = []
         
@@ -1572,7 +1770,7 @@ async def get_articles(
         articles = cursor.fetchall()
         
         # Get total count
-        count_query = 'SELECT COUNT(*) FROM articles a LEFT JOIN categories c ON a.category_id = c.id WHERE a.is_approved = 1'
+        count_query = 'SELECT COUNT(*) FROM articles a LEFT JOIN categories c ON a.category_id = c.id WHERE a.status = 1'
         count_params = []
         
         if category:
@@ -1603,31 +1801,34 @@ async def get_articles(
             article_dict.setdefault('full_content', None)
             article_dict.setdefault('human_summary', None)  # ADDED
             
-            # Add content length info
+            # content_length is a generated column
             if article_dict.get('full_content'):
-                article_dict['content_length'] = len(article_dict['full_content'])
-                article_dict['has_full_content'] = len(article_dict['full_content']) > len(article_dict.get('content', '')) + 100
+                article_dict['has_full_content'] = len(article_dict['full_content']) > len(article_dict.get('content') or '') + 100
             else:
-                article_dict['content_length'] = len(article_dict.get('content', ''))
                 article_dict['has_full_content'] = False
             
             result.append(article_dict)
         
         conn.close()
         
-        return {
+        content = orjson.dumps({
             "articles": result,
             "total": total,
             "skip": skip,
             "limit": limit
-        }
+        })
+        if cache_key is not None:
+            with feed_cache_lock:
+                feed_cache[cache_key] = content
+        
+        return Response(content=content, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error fetching articles: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/articles/{article_id}")
-async def get_article(article_id: int):
+def get_article(article_id: int):
     """Get single article by ID."""
     try:
         conn = get_db_connection()
@@ -1637,7 +1838,7 @@ async def get_article(article_id: int):
             SELECT a.*, c.name as category_name 
             FROM articles a 
             LEFT JOIN categories c ON a.category_id = c.id 
-            WHERE a.id = ? AND a.is_approved = 1
+            WHERE a.id = ? AND a.status = 1
         ''', (article_id,))
         
         article = cursor.fetchone()
@@ -1646,6 +1847,8 @@ async def get_article(article_id: int):
             conn.close()
             raise HTTPException(status_code=404, detail="Article not found")
         
+        record_article_view(article_id)
+        
         # Convert to dictionary
         article_dict = dict(article)
         article_dict.setdefault('category_name', 'General')
@@ -1656,13 +1859,8 @@ async def get_article(article_id: int):
         article_dict.setdefault('full_content', None)
         article_dict.setdefault('human_summary', None)  # ADDED
         
-        # Add content info
-        if article_dict.get('full_content'):
-            article_dict['has_full_content'] = True
-            article_dict['content_length'] = len(article_dict['full_content'])
-        else:
-            article_dict['has_full_content'] = False
-            article_dict['content_length'] = len(article_dict.get('content', ''))
+        # Add content info (content_length is a generated column)
+        article_dict['has_full_content'] = bool(article_dict.get('full_content'))
         
         # Get related articles
         language = article_dict.get('language', 'en')
@@ -1672,7 +1870,7 @@ async def get_article(article_id: int):
             SELECT a.*, c.name as category_name 
             FROM articles a 
             LEFT JOIN categories c ON a.category_id = c.id 
-            WHERE a.category_id = ? AND a.id != ? AND a.language = ? AND a.is_approved = 1
+            WHERE a.category_id = ? AND a.id != ? AND a.language = ? AND a.status = 1
             ORDER BY a.published_at DESC 
             LIMIT 5
         ''', (category_id, article_id, language))
@@ -1700,7 +1898,7 @@ async def get_article(article_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/articles/breaking/")
-async def get_breaking_articles(limit: int = Query(20, ge=1, le=100)):
+def get_breaking_articles(limit: int = Query(20, ge=1, le=100)):
     """Get breaking news (last 24 hours)."""
     try:
         time_threshold = (datetime.now() - timedelta(hours=24)).isoformat()
@@ -1712,7 +1910,7 @@ async def get_breaking_articles(limit: int = Query(20, ge=1, le=100)):
             SELECT a.*, c.name as category_name 
             FROM articles a 
             LEFT JOIN categories c ON a.category_id = c.id 
-            WHERE a.published_at > ? AND a.is_approved = 1
+            WHERE a.published_at > ? AND a.status = 1
             ORDER BY a.published_at DESC 
             LIMIT ?
         ''', (time_threshold, limit))
@@ -1743,7 +1941,7 @@ async def get_breaking_articles(limit: int = Query(20, ge=1, le=100)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/categories")
-async def get_categories():
+def get_categories():
     """Get all categories."""
     try:
         conn = get_db_connection()
@@ -1759,7 +1957,7 @@ async def get_categories():
         return []
 
 @app.get("/api/v1/fetcher/stats")
-async def get_fetcher_stats():
+def get_fetcher_stats():
     """Get system statistics."""
     try:
         conn = get_db_connection()
@@ -1777,7 +1975,7 @@ async def get_fetcher_stats():
         cursor.execute('SELECT COUNT(*) FROM articles WHERE LENGTH(full_content) > LENGTH(content) + 100')
         full_content_count = cursor.fetchone()[0]
         
-        cursor.execute('SELECT COUNT(*) FROM articles WHERE is_approved = 0')
+        cursor.execute('SELECT COUNT(*) FROM articles WHERE status = 0')
         pending_approval = cursor.fetchone()[0]
         
         cursor.execute('SELECT COUNT(*) FROM articles WHERE human_summary IS NOT NULL')  # ADDED
@@ -1841,7 +2039,7 @@ async def fetch_now(background_tasks: BackgroundTasks):
 # ==================== CONTENT PREVIEW ENDPOINTS ====================
 
 @app.get("/api/v1/preview/articles/{article_id}")
-async def get_article_preview(article_id: int):
+def get_article_preview(article_id: int):
     """Get content preview for an article."""
     try:
         conn = get_db_connection()
@@ -1922,7 +2120,7 @@ async def get_article_preview(article_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/v1/preview/articles/{article_id}/generate")
-async def generate_preview(article_id: int):
+def generate_preview(article_id: int):
     """Generate content preview for an article."""
     try:
         conn = get_db_connection()
@@ -2007,12 +2205,6 @@ async def debug_extract_test(url: str = Query(..., description="URL to test cont
             "success": False
         }
 
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup"""
-    init_db()
-    print("✅ Database initialized")
-
 # ==================== MAIN ENTRY POINT ====================
 
 if __name__ == "__main__":
@@ -0,0 +1,41 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.caches import feed_cache, feed_cache_lock
+from app.database import Base
+from app.models import Article, ArticleStatus
+from app.routes import admin
+
+
+def test_approving_an_article_clears_the_feed_cache():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        article = Article(title="Title", url="https://a", source="Test", language="en")
+        session.add(article)
+        session.commit()
+
+        with feed_cache_lock:
+            feed_cache[(0, 20, None, None)] = b"stale"
+        admin._update_article(session, article.id, {'status': ArticleStatus.APPROVED})
+
+        assert len(feed_cache) == 0
+        session.expire_all()
+        assert session.get(Article, article.id).status == ArticleStatus.APPROVED
+
+
+def test_bulk_review_clears_the_feed_cache():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([
+            Article(title="One", url="https://a", source="Test", language="en"),
+            Article(title="Two", url="https://b", source="Test", language="en"),
+        ])
+        session.commit()
+
+        with feed_cache_lock:
+            feed_cache[(0, 20, None, None)] = b"stale"
+        assert admin._review_pending(session, ArticleStatus.REJECTED, "admin") == 2
+
+        assert len(feed_cache) == 0
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models import Article
+from app.routes import admin
+
+
+def _seed(session):
+    day = datetime(2026, 1, 12, 8, 0)
+    articles = [
+        Article(title=f"Article {i}", url=f"https://example.com/{i}", source="Test", language="en",
+                published_at=day + timedelta(hours=i % 5, minutes=i))
+        for i in range(23)
+    ]
+    articles += [
+        Article(title=f"Undated {i}", url=f"https://example.com/undated/{i}", source="Test", language="en")
+        for i in range(3)
+    ]
+    session.add_all(articles)
+    session.commit()
+    # Rows written by the fetcher store ISO text with a "T" separator
+    session.execute(text(
+        "UPDATE articles SET published_at = replace(published_at, ' ', 'T') WHERE id % 2 = 0"
+    ))
+    session.commit()
+
+
+def test_seek_pages_match_offset_pages():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        _seed(session)
+        limit = 4
+        offset_pages = []
+        page = 1
+        while True:
+            rows = session.scalars(admin._pending_page_stmt(page, limit)).all()
+            if not rows:
+                break
+            offset_pages.append([a.id for a in rows])
+            page += 1
+
+        seek_pages = []
+        cursor = (None, None)
+        while True:
+            rows = session.scalars(admin._pending_page_stmt(1, limit, *cursor)).all()
+            if not rows:
+                break
+            seek_pages.append([a.id for a in rows])
+            cursor = admin._seek_cursor(session, rows[-1])
+
+        assert seek_pages == offset_pages
+        assert sum(len(p) for p in seek_pages) == 26
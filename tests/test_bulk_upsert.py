@@ -0,0 +1,26 @@
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.minimal_models import Article
+
+
+def _row(url, title="Title"):
+    return {"title": title, "url": url, "source": "Test", "language": "en"}
+
+
+def test_bulk_upsert_counts_only_new_urls():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        assert Article.bulk_upsert(session, [_row("https://a"), _row("https://b")]) == 2
+        session.commit()
+
+        # One existing URL, one new one, and a duplicate within the batch
+        rows = [_row("https://a", "Changed"), _row("https://c"), _row("https://c")]
+        assert Article.bulk_upsert(session, rows, batch_size=2) == 1
+        session.commit()
+
+        assert session.scalar(select(func.count()).select_from(Article)) == 3
+        # Existing rows are left untouched
+        assert session.scalar(select(Article.title).where(Article.url == "https://a")) == "Title"